@@ -72,6 +72,7 @@ def run():
         host=proxy_settings.host,
         port=proxy_settings.port,
         log_level=proxy_settings.log_level.lower(),
+        loop=proxy_settings.event_loop,
         ssl_keyfile=proxy_settings.https_key_file if proxy_settings.use_https else None,
         ssl_certfile=(
             proxy_settings.https_cert_file if proxy_settings.use_https else None
@@ -24,6 +24,7 @@ from gpt2giga.common.gigachat_options import (
     gigachat_request_options,
 )
 from gpt2giga.common.streaming import (
+    coalesce_sse_frames,
     stream_responses_chat_completion_generator,
     stream_responses_generator,
 )
@@ -96,21 +97,23 @@ class NativeGigaChatResponsesExecutor:
                 )
                 await acquired_model_limit.__aenter__()
                 return StreamingResponse(
-                    observe_openai_response_stream(
-                        state,
-                        stream_responses_chat_completion_generator(
-                            request,
-                            chat_request,
-                            current_rquid,
-                            giga_client,
-                            request_data=data,
-                            request_options=request_options,
-                            model_limiter=model_limiter,
-                            effective_model=model_resolution.limiter_key,
-                            acquired_model_limit=acquired_model_limit,
-                        ),
-                        request_payload=data,
-                        context=get_request_context(),
+                    coalesce_sse_frames(
+                        observe_openai_response_stream(
+                            state,
+                            stream_responses_chat_completion_generator(
+                                request,
+                                chat_request,
+                                current_rquid,
+                                giga_client,
+                                request_data=data,
+                                request_options=request_options,
+                                model_limiter=model_limiter,
+                                effective_model=model_resolution.limiter_key,
+                                acquired_model_limit=acquired_model_limit,
+                            ),
+                            request_payload=data,
+                            context=get_request_context(),
+                        )
                     ),
                     media_type="text/event-stream",
                 )
@@ -200,15 +203,17 @@ class NativeGigaChatResponsesExecutor:
             acquired_model_limit=acquired_model_limit,
         )
         return StreamingResponse(
-            observe_openai_response_stream(
-                state,
-                stitch_responses_stream(
-                    request,
-                    conversation_turn,
-                    response_stream,
-                ),
-                request_payload=data,
-                context=get_request_context(),
+            coalesce_sse_frames(
+                observe_openai_response_stream(
+                    state,
+                    stitch_responses_stream(
+                        request,
+                        conversation_turn,
+                        response_stream,
+                    ),
+                    request_payload=data,
+                    context=get_request_context(),
+                )
             ),
             media_type="text/event-stream",
         )
@@ -361,11 +366,13 @@ class NormalizedBridgeResponsesExecutor:
             emit_stream(),
         )
         return StreamingResponse(
-            observe_openai_response_stream(
-                state,
-                response_stream,
-                request_payload=data,
-                context=context,
+            coalesce_sse_frames(
+                observe_openai_response_stream(
+                    state,
+                    response_stream,
+                    request_payload=data,
+                    context=context,
+                )
             ),
             media_type="text/event-stream",
         )
@@ -2,6 +2,21 @@ import ast
 import json
 from typing import Any
 
+# First characters of inputs that ast.literal_eval can parse.
+_PYTHON_LITERAL_STARTS = frozenset("{[('\"\\-+.0123456789#TFN")
+_STRING_PREFIX_CHARS = frozenset("rRbBuU")
+
+
+def _may_be_python_literal(value: str) -> bool:
+    """Return whether ``value`` could parse as a Python literal."""
+    # ast.literal_eval tolerates leading whitespace, e.g. "\n{'a': 1}".
+    value = value.lstrip()
+    first = value[:1]
+    if first in _PYTHON_LITERAL_STARTS:
+        return True
+    # Prefixed string literals such as u'...' or rb"...".
+    return first in _STRING_PREFIX_CHARS and ("'" in value[1:3] or '"' in value[1:3])
+
 
 def ensure_json_object_str(value: Any) -> str:
     """
@@ -52,7 +67,7 @@ def ensure_json_object_str(value: Any) -> str:
         if isinstance(s, (list, int, float, bool)) or s is None:
             return json.dumps({"result": s}, ensure_ascii=False)
 
-        if isinstance(s, str):
+        if isinstance(s, str) and _may_be_python_literal(s):
             try:
                 lit = ast.literal_eval(s)
                 if isinstance(lit, dict):
@@ -60,5 +75,7 @@ def ensure_json_object_str(value: Any) -> str:
                 return json.dumps({"result": lit}, ensure_ascii=False)
             except Exception:
                 return json.dumps({"result": s}, ensure_ascii=False)
+        if isinstance(s, str):
+            return json.dumps({"result": s}, ensure_ascii=False)
 
     return json.dumps({"result": value}, ensure_ascii=False)
@@ -26,7 +26,7 @@ def log_debug_payload(
     **extra: Any,
 ) -> None:
     """Log full payloads in non-PROD DEBUG logs while omitting them in PROD."""
-    if logger is None or not _is_debug_logging_enabled(config_or_mode, log_level):
+    if logger is None or not is_debug_logging_enabled(config_or_mode, log_level):
         return
 
     if _is_prod_mode(config_or_mode):
@@ -66,9 +66,9 @@ def _is_prod_mode(config_or_mode: Any) -> bool:
     return isinstance(mode, str) and mode.upper() == "PROD"
 
 
-def _is_debug_logging_enabled(
+def is_debug_logging_enabled(
     config_or_mode: Any,
-    explicit_log_level: str | None,
+    explicit_log_level: str | None = None,
 ) -> bool:
     """Return whether payload serialization can reach a DEBUG log sink."""
     log_level = explicit_log_level
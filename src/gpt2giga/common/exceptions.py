@@ -116,7 +116,7 @@ def exceptions_handler(func):
             from loguru import logger
 
             rquid = rquid_context.get()
-            logger.error(f"[{rquid}] GigaChatException: {type(e).__name__}: {e}")
+            logger.error("[{}] GigaChatException: {}: {}", rquid, type(e).__name__, e)
             for exc_class, (status, error_type, code) in ERROR_MAPPING.items():
                 if isinstance(e, exc_class):
                     raise HTTPException(
@@ -3,10 +3,22 @@ import json
 from fastapi import HTTPException
 from starlette.requests import Request
 
+from gpt2giga.common.client_params import openai_error_payload
 from gpt2giga.common.debug_logging import log_debug_payload
 from gpt2giga.core.context import update_request_context
 from gpt2giga.sinks.logs.emission import capture_traffic_request_body
 
+_EMPTY_BODY_MESSAGE = "Request body is empty (expected JSON)."
+_NOT_OBJECT_MESSAGE = "Invalid JSON body: expected an object at the top level."
+
+
+def _invalid_json_error(message: str) -> HTTPException:
+    """Build the 400 error raised for unreadable JSON request bodies."""
+    return HTTPException(
+        status_code=400,
+        detail=openai_error_payload(message, code="invalid_json"),
+    )
+
 
 async def read_request_json(request: Request) -> dict:
     """Read and parse JSON request body.
@@ -18,44 +30,18 @@ async def read_request_json(request: Request) -> dict:
         HTTPException: If body is empty or invalid JSON.
     """
     body = await request.body()
-    if not body or not body.strip():
-        raise HTTPException(
-            status_code=400,
-            detail={
-                "error": {
-                    "message": "Request body is empty (expected JSON).",
-                    "type": "invalid_request_error",
-                    "param": None,
-                    "code": "invalid_json",
-                }
-            },
-        )
+    if not body:
+        raise _invalid_json_error(_EMPTY_BODY_MESSAGE)
     try:
         data = json.loads(body)
     except json.JSONDecodeError as e:
-        raise HTTPException(
-            status_code=400,
-            detail={
-                "error": {
-                    "message": f"Invalid JSON body: {e.msg}",
-                    "type": "invalid_request_error",
-                    "param": None,
-                    "code": "invalid_json",
-                }
-            },
-        )
+        # Whitespace-only bodies are told apart only on the error path, so
+        # valid payloads are never copied by ``strip()``.
+        if not body.strip():
+            raise _invalid_json_error(_EMPTY_BODY_MESSAGE)
+        raise _invalid_json_error(f"Invalid JSON body: {e.msg}")
     if not isinstance(data, dict):
-        raise HTTPException(
-            status_code=400,
-            detail={
-                "error": {
-                    "message": "Invalid JSON body: expected an object at the top level.",
-                    "type": "invalid_request_error",
-                    "param": None,
-                    "code": "invalid_json",
-                }
-            },
-        )
+        raise _invalid_json_error(_NOT_OBJECT_MESSAGE)
     update_request_context(model_requested=data.get("model"))
     capture_traffic_request_body(request, data)
     state = request.app.state
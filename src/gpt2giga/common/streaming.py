@@ -1,13 +1,14 @@
 import asyncio
+import contextlib
 import json
 import time
 from types import SimpleNamespace
-from typing import Any, AsyncGenerator, Optional
+from typing import Any, AsyncGenerator, AsyncIterator, Optional
 
 import gigachat
 from aioitertools import enumerate as aio_enumerate
 from gigachat import GigaChat
-from gigachat.models import Chat
+from gigachat.models import Chat, ChatCompletionChunk
 from starlette.requests import Request
 
 from gpt2giga.app_state import get_gigachat_client, get_model_concurrency_limiter
@@ -41,6 +42,10 @@ from gpt2giga.protocol.response import (
 from gpt2giga.protocol.response.processor import ResponseProcessor
 from gpt2giga.providers.gigachat.model_resolution import resolve_upstream_model
 
+_SSE_COALESCE_MAX_BYTES = 4096
+_SSE_COALESCE_QUEUE_SIZE = 64
+_UPSTREAM_PREFETCH_SIZE = 8
+
 
 async def stream_chat_generator(
     request: Request,
@@ -77,7 +82,7 @@ async def stream_chat_generator(
                     if await request.is_disconnected():
                         if logger:
                             logger.info(
-                                f"[{rquid}] Client disconnected during streaming"
+                                "[{}] Client disconnected during streaming", rquid
                             )
                         break
                     processed = (
@@ -168,11 +173,8 @@ async def stream_chat_generator(
 
     except gigachat.exceptions.GigaChatException as e:
         error_type = type(e).__name__
-        error_message = str(e)
         if logger:
-            logger.error(
-                f"[{rquid}] GigaChat streaming error: {error_type}: {error_message}"
-            )
+            logger.error("[{}] GigaChat streaming error: {}: {}", rquid, error_type, e)
         error_response = {
             "error": {
                 "message": "Upstream service error",
@@ -190,7 +192,9 @@ async def stream_chat_generator(
     except Exception as e:
         error_type = type(e).__name__
         if logger:
-            logger.error(f"[{rquid}] Unexpected streaming error: {error_type}: {e}")
+            logger.error(
+                "[{}] Unexpected streaming error: {}: {}", rquid, error_type, e
+            )
         error_response = {
             "error": {
                 "message": "Stream interrupted",
@@ -237,7 +241,7 @@ async def stream_chat_completion_generator(
                     if await request.is_disconnected():
                         if logger:
                             logger.info(
-                                f"[{rquid}] Client disconnected during streaming"
+                                "[{}] Client disconnected during streaming", rquid
                             )
                         break
                     adapted = adapt_chat_completion_chunk_to_chat_chunk_shape(
@@ -332,11 +336,8 @@ async def stream_chat_completion_generator(
 
     except gigachat.exceptions.GigaChatException as e:
         error_type = type(e).__name__
-        error_message = str(e)
         if logger:
-            logger.error(
-                f"[{rquid}] GigaChat streaming error: {error_type}: {error_message}"
-            )
+            logger.error("[{}] GigaChat streaming error: {}: {}", rquid, error_type, e)
         error_response = {
             "error": {
                 "message": "Upstream service error",
@@ -353,7 +354,9 @@ async def stream_chat_completion_generator(
     except Exception as e:
         error_type = type(e).__name__
         if logger:
-            logger.error(f"[{rquid}] Unexpected streaming error: {error_type}: {e}")
+            logger.error(
+                "[{}] Unexpected streaming error: {}: {}", rquid, error_type, e
+            )
         error_response = {
             "error": {
                 "message": "Stream interrupted",
@@ -615,8 +618,6 @@ async def stream_responses_generator(
     acquired_model_limit: Optional[Any] = None,
     response_id_from_stream_metadata: bool = False,
 ) -> AsyncGenerator[str, None]:
-    import time
-
     logger = None
     rquid = rquid_context.get()
     created_at = int(time.time())
@@ -1041,8 +1042,7 @@ async def stream_responses_generator(
             output_item_added = True
             return events
 
-        async def iterate_chunks_with_optional_prefetch():
-            stream = aio_enumerate(giga_client.astream(chat_messages))
+        async def iterate_chunks_with_optional_prefetch(stream):
             if not response_id_from_stream_metadata:
                 for event in response_start_events():
                     yield event, None
@@ -1061,7 +1061,7 @@ async def stream_responses_generator(
                     yield event, None
                 raise
             if first_item is not None:
-                first_giga_dict = first_item[1].model_dump()
+                first_giga_dict = _stream_chunk_payload(first_item[1])
                 response_metadata.update(
                     extract_gigachat_response_metadata(first_giga_dict.get("x_headers"))
                 )
@@ -1080,11 +1080,17 @@ async def stream_responses_generator(
             nonlocal final_usage, full_text, function_call_data, functions_state_id
             nonlocal is_function_call, output_item_added, raw_full_text, reasoning_text
             nonlocal sequence_number, source_rendering_enabled, text_output_index
-            async with gigachat_request_options(giga_client, request_options):
-                async for (
-                    prebuilt_event,
-                    chunk_item,
-                ) in iterate_chunks_with_optional_prefetch():
+            x_headers_read = False
+            async with (
+                gigachat_request_options(giga_client, request_options),
+                contextlib.aclosing(
+                    _prefetch_upstream(giga_client.astream(chat_messages))
+                ) as upstream,
+                contextlib.aclosing(
+                    iterate_chunks_with_optional_prefetch(aio_enumerate(upstream))
+                ) as chunks,
+            ):
+                async for prebuilt_event, chunk_item in chunks:
                     if prebuilt_event is not None:
                         yield prebuilt_event
                         continue
@@ -1092,11 +1098,14 @@ async def stream_responses_generator(
                     if await request.is_disconnected():
                         if logger:
                             logger.info(
-                                f"[{rquid}] Client disconnected during streaming"
+                                "[{}] Client disconnected during streaming", rquid
                             )
                         break
 
-                    giga_dict = chunk.model_dump()
+                    if _is_empty_stream_chunk(chunk, x_headers_read=x_headers_read):
+                        continue
+                    giga_dict = _stream_chunk_payload(chunk)
+                    x_headers_read = x_headers_read or bool(giga_dict.get("x_headers"))
                     response_metadata.update(
                         extract_gigachat_response_metadata(giga_dict.get("x_headers"))
                     )
@@ -1474,11 +1483,8 @@ async def stream_responses_generator(
 
     except gigachat.exceptions.GigaChatException as e:
         error_type = type(e).__name__
-        error_message = str(e)
         if logger:
-            logger.error(
-                f"[{rquid}] GigaChat streaming error: {error_type}: {error_message}"
-            )
+            logger.error("[{}] GigaChat streaming error: {}: {}", rquid, error_type, e)
         error_response = {
             "type": "error",
             "code": "stream_error",
@@ -1494,7 +1500,9 @@ async def stream_responses_generator(
     except Exception as e:
         error_type = type(e).__name__
         if logger:
-            logger.error(f"[{rquid}] Unexpected streaming error: {error_type}: {e}")
+            logger.error(
+                "[{}] Unexpected streaming error: {}: {}", rquid, error_type, e
+            )
         error_response = {
             "type": "error",
             "code": "internal_error",
@@ -1508,6 +1516,162 @@ async def stream_responses_generator(
             await acquired_model_limit.__aexit__(None, None, None)
 
 
+class _ProducerDone:
+    """Queue marker for the end of a producer task, with its error if any."""
+
+    __slots__ = ("error",)
+
+    def __init__(self, error: Optional[BaseException] = None) -> None:
+        self.error = error
+
+
+async def _iter_ready_batches(
+    items: AsyncIterator[Any],
+    *,
+    maxsize: int,
+) -> AsyncGenerator[list[Any], None]:
+    """Yield items read by a producer task in batches of what is already queued.
+
+    Each batch waits for one item and then takes the queued items without
+    awaiting, so it never waits for an item that has not arrived yet. An error
+    raised by ``items`` is re-raised after the items that preceded it.
+    """
+    queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=maxsize)
+    closing = False
+
+    async def produce() -> None:
+        try:
+            async for item in items:
+                await queue.put(item)
+        except BaseException as exc:
+            if closing:
+                raise
+            await queue.put(_ProducerDone(exc))
+            return
+        finally:
+            aclose = getattr(items, "aclose", None)
+            if aclose is not None:
+                await aclose()
+        await queue.put(_ProducerDone())
+
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            batch = [await queue.get()]
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            done = batch[-1]
+            if isinstance(done, _ProducerDone):
+                batch.pop()
+            if batch:
+                yield batch
+            if isinstance(done, _ProducerDone):
+                if done.error is not None:
+                    raise done.error
+                return
+    finally:
+        closing = True
+        if not producer.done():
+            producer.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await producer
+
+
+async def _prefetch_upstream(
+    items: AsyncIterator[Any],
+    *,
+    maxsize: int = _UPSTREAM_PREFETCH_SIZE,
+) -> AsyncGenerator[Any, None]:
+    """Read upstream chunks ahead of the consumer while it encodes frames."""
+    async with contextlib.aclosing(
+        _iter_ready_batches(items, maxsize=maxsize)
+    ) as batches:
+        async for batch in batches:
+            for item in batch:
+                yield item
+
+
+async def coalesce_sse_frames(
+    frames: AsyncIterator[str],
+    *,
+    max_bytes: int = _SSE_COALESCE_MAX_BYTES,
+) -> AsyncGenerator[str, None]:
+    """Join SSE frames that are already buffered into one body chunk.
+
+    Frames are read by a producer task, and each body chunk holds only the
+    frames that are ready without awaiting, so back-to-back bursts reach the
+    ASGI server as one write while a lone delta is still forwarded as soon as
+    the upstream stalls.
+    """
+    async with contextlib.aclosing(
+        _iter_ready_batches(frames, maxsize=_SSE_COALESCE_QUEUE_SIZE)
+    ) as batches:
+        async for batch in batches:
+            pending: list[str] = []
+            pending_size = 0
+            for frame in batch:
+                pending.append(frame)
+                pending_size += len(frame)
+                if pending_size >= max_bytes:
+                    yield "".join(pending)
+                    pending = []
+                    pending_size = 0
+            if pending:
+                yield "".join(pending)
+
+
+def _is_empty_stream_chunk(chunk: Any, *, x_headers_read: bool) -> bool:
+    """Return whether an SDK chunk carries nothing the Responses stream reads.
+
+    Role-only and finish-reason chunks have no text, reasoning, function call
+    or usage, so they can be skipped before any payload is built. The SDK
+    attaches the same response ``x_headers`` to every chunk of a stream, so
+    they only count until they have been read once.
+    """
+    if not isinstance(chunk, ChatCompletionChunk) or not chunk.choices:
+        return False
+    delta = chunk.choices[0].delta
+    return not (
+        delta.content
+        or delta.reasoning_content
+        or delta.function_call
+        or chunk.usage
+        or (chunk.x_headers and not x_headers_read)
+    )
+
+
+def _stream_chunk_payload(chunk: Any) -> dict[str, Any]:
+    """Return the chunk fields read by the Responses stream.
+
+    SDK chunks are read attribute-by-attribute so only the nested models that
+    are present get dumped; adapted chunks fall back to their own ``model_dump``.
+    """
+    if not isinstance(chunk, ChatCompletionChunk) or not chunk.choices:
+        return chunk.model_dump()
+
+    delta = chunk.choices[0].delta
+    function_call = delta.function_call
+    return {
+        "x_headers": chunk.x_headers,
+        "usage": chunk.usage.model_dump() if chunk.usage is not None else None,
+        "choices": [
+            {
+                "delta": {
+                    "role": delta.role,
+                    "content": delta.content,
+                    "reasoning_content": delta.reasoning_content,
+                    "function_call": (
+                        function_call.model_dump()
+                        if function_call is not None
+                        else None
+                    ),
+                    "functions_state_id": delta.functions_state_id,
+                }
+            }
+        ],
+    }
+
+
 def _extract_provider_response_metadata(data: dict[str, Any]) -> dict[str, str]:
     raw_metadata = data.get(GIGACHAT_PROVIDER_METADATA_KEY)
     if not isinstance(raw_metadata, dict):
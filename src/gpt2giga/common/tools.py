@@ -6,14 +6,10 @@ from gigachat.models import Function, FunctionParameters
 
 from gpt2giga.common.json_schema import normalize_tool_parameters_schema
 
-_RESERVED_GIGACHAT_TOOL_NAME_MAP = {
-    # У GigaChat есть встроенный tool под названием "web_search".
-    # Если пользователь передает custom tool с таким же названием, это может вызвать конфликт на стороне GigaChat.
-    "web_search": "__gpt2giga_user_search_web",
-}
-_RESERVED_GIGACHAT_TOOL_NAME_MAP_REVERSE = {
-    v: k for k, v in _RESERVED_GIGACHAT_TOOL_NAME_MAP.items()
-}
+# У GigaChat есть встроенный tool под названием "web_search".
+# Если пользователь передает custom tool с таким же названием, это может вызвать конфликт на стороне GigaChat.
+_RESERVED_GIGACHAT_TOOL_NAME = "web_search"
+_RESERVED_GIGACHAT_TOOL_NAME_REPLACEMENT = "__gpt2giga_user_search_web"
 GIGACHAT_BUILTIN_TOOL_TYPES = (
     "web_search",
     "url_content_extraction",
@@ -50,7 +46,9 @@ def map_tool_name_to_gigachat(name: str) -> str:
     Returns:
         Name safe to send to GigaChat (may be unchanged).
     """
-    return _RESERVED_GIGACHAT_TOOL_NAME_MAP.get(name, name)
+    if name == _RESERVED_GIGACHAT_TOOL_NAME:
+        return _RESERVED_GIGACHAT_TOOL_NAME_REPLACEMENT
+    return name
 
 
 def map_tool_name_from_gigachat(name: str) -> str:
@@ -62,7 +60,9 @@ def map_tool_name_from_gigachat(name: str) -> str:
     Returns:
         Name to return to the client (may be unchanged).
     """
-    return _RESERVED_GIGACHAT_TOOL_NAME_MAP_REVERSE.get(name, name)
+    if name == _RESERVED_GIGACHAT_TOOL_NAME_REPLACEMENT:
+        return _RESERVED_GIGACHAT_TOOL_NAME
+    return name
 
 
 def map_namespaced_tool_name_to_gigachat(namespace: str, name: str) -> str:
@@ -91,7 +91,29 @@ SENSITIVE_KEYS = frozenset(
     }
 )
 
-_KEYS_PATTERN = "|".join(re.escape(k) for k in SENSITIVE_KEYS)
+# Lowercase substrings, at least one of which occurs in every sensitive key
+# and in a Bearer header; messages without any of them skip redaction.
+SENSITIVE_TRIGGERS = (
+    "key",
+    "token",
+    "passw",
+    "credentials",
+    "authorization",
+    "secret",
+    "bearer",
+)
+
+# Same prescreen for non-ASCII messages, where IGNORECASE matching also folds
+# characters such as "İ", "ı" or "ſ" that str.lower() does not map to ASCII.
+SENSITIVE_TRIGGER_RE = re.compile(
+    "|".join(re.escape(trigger) for trigger in SENSITIVE_TRIGGERS), re.IGNORECASE
+)
+
+# Longest keys first, in a stable order, so prefix overlaps such as
+# "secret"/"secret_key" resolve without backtracking into a shorter branch.
+_KEYS_PATTERN = "|".join(
+    re.escape(k) for k in sorted(SENSITIVE_KEYS, key=lambda k: (-len(k), k))
+)
 
 # "key": "value" or 'key': 'value' (JSON-style)
 JSON_KV_RE = re.compile(
@@ -99,15 +121,12 @@ JSON_KV_RE = re.compile(
     re.IGNORECASE,
 )
 
-# key=value (query-param / env-var style)
-KV_EQ_RE = re.compile(
-    r"\b({keys})=([^\s&,;]+)".format(keys=_KEYS_PATTERN),
+# key=value (query-param / env-var style) or Bearer <token>, in one pass.
+KV_EQ_OR_BEARER_RE = re.compile(
+    r"\b(?P<key>{keys})=[^\s&,;]+|(?P<bearer>Bearer\s+)\S+".format(keys=_KEYS_PATTERN),
     re.IGNORECASE,
 )
 
-# Bearer <token>
-BEARER_RE = re.compile(r"(Bearer\s+)\S+", re.IGNORECASE)
-
 SENSITIVE_CLI_ARGS = frozenset(
     {
         "--proxy.api-key",
@@ -8,19 +8,40 @@ from typing import Any
 
 from loguru import logger
 
-from .constants import BEARER_RE, JSON_KV_RE, KV_EQ_RE, SENSITIVE_KEYS
+from .constants import (
+    JSON_KV_RE,
+    KV_EQ_OR_BEARER_RE,
+    SENSITIVE_KEYS,
+    SENSITIVE_TRIGGER_RE,
+    SENSITIVE_TRIGGERS,
+)
 
 # Context variable for rquid
 rquid_context = contextvars.ContextVar("rquid", default="-")
 _LOGURU_TAG_RE = re.compile(r"(\\*)(</?(?:[fb]g\s)?[^<>\s]*>)")
 
 
+def _redact_kv_eq_or_bearer(match: re.Match[str]) -> str:
+    key = match.group("key")
+    if key is not None:
+        return f"{key}=***"
+    return f"{match.group('bearer')}***"
+
+
 def redact_sensitive(message: str) -> str:
-    """Replace values of sensitive keys in a log message with '***'."""
+    """Replace values of sensitive keys in a log message with '***'.
+
+    JSON pairs are redacted first so a ``key=`` or ``Bearer`` match cannot
+    consume the key of a JSON pair and leave its value in place.
+    """
+    if message.isascii():
+        lowered = message.lower()
+        if not any(trigger in lowered for trigger in SENSITIVE_TRIGGERS):
+            return message
+    elif SENSITIVE_TRIGGER_RE.search(message) is None:
+        return message
     message = JSON_KV_RE.sub(r"\1\2\1: \3***\3", message)
-    message = KV_EQ_RE.sub(r"\1=***", message)
-    message = BEARER_RE.sub(r"\1***", message)
-    return message
+    return KV_EQ_OR_BEARER_RE.sub(_redact_kv_eq_or_bearer, message)
 
 
 def redact_sensitive_data(value: Any) -> Any:
@@ -49,14 +70,17 @@ def get_rquid() -> str:
     return rquid_context.get()
 
 
-def _escape_loguru_markup(text: str) -> str:
-    """Escape Loguru color tags while preserving visible text."""
+def _escape_loguru_tag(match: re.Match[str]) -> str:
+    slashes, tag = match.groups()
+    return "\\" * (len(slashes) * 2 + 1) + tag
 
-    def escape_match(match: re.Match[str]) -> str:
-        slashes, tag = match.groups()
-        return "\\" * (len(slashes) * 2 + 1) + tag
 
-    return _LOGURU_TAG_RE.sub(escape_match, text)
+def _escape_loguru_markup(text: str) -> str:
+    """Escape Loguru color tags while preserving visible text."""
+    # Every tag starts with "<", and most payloads contain none.
+    if "<" not in text:
+        return text
+    return _LOGURU_TAG_RE.sub(_escape_loguru_tag, text)
 
 
 def _format_structured_extra(extra: dict) -> str:
@@ -69,7 +93,18 @@ def _format_structured_extra(extra: dict) -> str:
     Loguru's format_map from interpreting them as format placeholders. Loguru
     markup-like tags are escaped because payload values are formatter literals.
     """
-    filtered = {k: v for k, v in extra.items() if k != "rquid" and v is not None}
+    # Most records carry only the patched-in rquid, or rquid plus one field.
+    if len(extra) <= 1 and (not extra or "rquid" in extra):
+        return ""
+    if len(extra) == 2 and "rquid" in extra:
+        for key, value in extra.items():
+            if key != "rquid":
+                break
+        if value is None:
+            return ""
+        filtered = {key: value}
+    else:
+        filtered = {k: v for k, v in extra.items() if k != "rquid" and v is not None}
     if not filtered:
         return ""
     try:
@@ -93,10 +128,11 @@ def setup_logger(
     log_level = log_level.upper()
 
     # Custom format that includes rquid and optional structured extra fields.
+    # strftime directives render the same timestamp without Loguru's token parser.
     def _format(record):
         extra_str = _format_structured_extra(record["extra"])
         return (
-            "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
+            "<green>{time:%Y-%m-%d %H:%M:%S}</green> | "
             "<level>{level: <8}</level> | "
             "<cyan>{extra[rquid]}</cyan> | "
             "<level>{message}</level>" + extra_str + "\n"
@@ -118,16 +154,26 @@ def setup_logger(
         format=_format,
     )
 
-    _do_redact = enable_redaction
+    # The patcher runs for every record, so pick the variant once and bind the
+    # hot callables as defaults instead of branching and resolving globals.
+    if enable_redaction:
+
+        def patcher(
+            record,
+            _get_rquid=rquid_context.get,
+            _redact=redact_sensitive,
+            _redact_data=redact_sensitive_data,
+        ):
+            """Bind rquid context and redact sensitive data."""
+            record["extra"]["rquid"] = _get_rquid()
+            record["message"] = _redact(record["message"])
+            record["extra"] = _redact_data(record["extra"])
 
-    class RquidAndRedactPatcher:
-        """Bind rquid context and optionally redact sensitive data."""
+    else:
 
-        def __call__(self, record):
-            record["extra"]["rquid"] = get_rquid()
-            if _do_redact:
-                record["message"] = redact_sensitive(record["message"])
-                record["extra"] = redact_sensitive_data(record["extra"])
+        def patcher(record, _get_rquid=rquid_context.get):
+            """Bind rquid context."""
+            record["extra"]["rquid"] = _get_rquid()
 
-    logger.configure(patcher=RquidAndRedactPatcher())
+    logger.configure(patcher=patcher)
     return logger
@@ -92,8 +92,8 @@ def _bearer_token(scope: Scope) -> str | None:
         if name.lower() != b"authorization":
             continue
         auth_header = value.decode("latin-1")
-        if auth_header.startswith("Bearer "):
-            return auth_header.removeprefix("Bearer ")
+        if auth_header[:7].lower() == "bearer ":
+            return auth_header[7:].strip() or None
     return None
 
 
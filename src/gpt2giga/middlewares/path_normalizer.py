@@ -1,5 +1,10 @@
 from starlette.types import ASGIApp, Receive, Scope, Send
 
+_API_VERSION_SEGMENTS = frozenset({"v1", "v2"})
+_DEFAULT_VALID_ROOTS = frozenset(
+    {"v1", "v2", "chat", "models", "embeddings", "messages", "responses"}
+)
+
 
 class PathNormalizationMiddleware:
     """
@@ -10,15 +15,9 @@ class PathNormalizationMiddleware:
     def __init__(self, app: ASGIApp, valid_roots=None):
         self.app = app
         # Valid entrypoints
-        self.valid_roots = valid_roots or [
-            "v1",
-            "v2",
-            "chat",
-            "models",
-            "embeddings",
-            "messages",
-            "responses",
-        ]
+        self.valid_roots = (
+            frozenset(valid_roots) if valid_roots else _DEFAULT_VALID_ROOTS
+        )
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         if scope["type"] != "http":
@@ -38,6 +37,16 @@ class PathNormalizationMiddleware:
 
     def _normalize_path(self, path: str) -> str | None:
         """Rewrite paths to start at the first recognized API root segment."""
+        # Fast path: most requests already start at a root with no duplicated
+        # or wrapped version segment, so they need no rewrite.
+        first, _, rest = path[1:].partition("/")
+        if first in self.valid_roots:
+            if first not in _API_VERSION_SEGMENTS:
+                return None
+            second = rest.partition("/")[0]
+            if second and second not in _API_VERSION_SEGMENTS:
+                return None
+
         segments = [segment for segment in path.split("/") if segment]
         if not segments:
             return None
@@ -51,7 +60,7 @@ class PathNormalizationMiddleware:
 
             while (
                 len(normalized_segments) > 1
-                and normalized_segments[0] in {"v1", "v2"}
+                and normalized_segments[0] in _API_VERSION_SEGMENTS
                 and normalized_segments[1] == normalized_segments[0]
             ):
                 normalized_segments.pop(1)
@@ -67,6 +76,6 @@ class PathNormalizationMiddleware:
         return (
             len(segments) > 2
             and segments[0] == "v2"
-            and segments[1] in {"v1", "v2"}
+            and segments[1] in _API_VERSION_SEGMENTS
             and segments[2] in self.valid_roots
         )
@@ -9,6 +9,9 @@ from starlette.types import ASGIApp, Receive, Scope, Send
 
 from gpt2giga.models.security import DEFAULT_MAX_REQUEST_BODY_BYTES
 
+# Only methods that carry a body are subject to the limit.
+_BODY_METHODS = frozenset({"POST", "PUT", "PATCH"})
+
 
 class RequestValidationMiddleware:
     """Reject requests whose Content-Length exceeds the configured limit.
@@ -27,21 +30,18 @@ class RequestValidationMiddleware:
         self.max_body_bytes = max_body_bytes
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
-        if scope["type"] != "http":
+        if scope["type"] != "http" or scope["method"] not in _BODY_METHODS:
             await self.app(scope, receive, send)
             return
-        # Only enforce on methods that carry a body.
-        if scope["method"] in {"POST", "PUT", "PATCH"}:
-            content_length = _header(scope, b"content-length")
-            if content_length is not None:
-                try:
-                    length = int(content_length)
-                except (TypeError, ValueError):
-                    length = 0
-                if length > self.max_body_bytes:
-                    response = self._too_large_response(length)
-                    await response(scope, receive, send)
-                    return
+
+        content_length = _header(scope, b"content-length")
+        # Non-numeric values are left to the server and endpoint-level limits.
+        if content_length is not None and content_length.isdecimal():
+            length = int(content_length)
+            if length > self.max_body_bytes:
+                response = self._too_large_response(length)
+                await response(scope, receive, send)
+                return
 
         await self.app(scope, receive, send)
 
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-import uuid
+import os
 from typing import Any
 
 from starlette.datastructures import Headers, MutableHeaders
@@ -39,7 +39,7 @@ class RquidMiddleware:
             return
 
         request = Request(scope, receive=receive)
-        request_id = str(uuid.uuid4())
+        request_id = _new_request_id()
         context = build_request_context(request, request_id=request_id)
         capture_traffic_request_headers(request, context)
         scope.setdefault("state", {})["request_context"] = context
@@ -87,6 +87,15 @@ class RquidMiddleware:
             request_context_var.reset(context_token)
 
 
+def _new_request_id() -> str:
+    """Return a random version 4 UUID string without building a ``UUID``."""
+    raw = bytearray(os.urandom(16))
+    raw[6] = raw[6] & 0x0F | 0x40
+    raw[8] = raw[8] & 0x3F | 0x80
+    value = raw.hex()
+    return f"{value[:8]}-{value[8:12]}-{value[12:16]}-{value[16:20]}-{value[20:]}"
+
+
 class _ResponseLifecycle:
     def __init__(self, *, request: Request, context: Any) -> None:
         self.request = request
@@ -39,6 +39,13 @@ class ProxySettings(BaseSettings):
     host: str = Field(default="localhost", description="Хост для запуска сервера")
     port: int = Field(default=8090, description="Порт для запуска сервера")
     use_https: bool = Field(default=False, description="Использовать ли https")
+    event_loop: Literal["auto", "asyncio", "uvloop"] = Field(
+        default="auto",
+        description=(
+            "Реализация event loop для uvicorn: auto выбирает uvloop, если он "
+            "установлен, иначе asyncio"
+        ),
+    )
     https_key_file: Optional[str] = Field(
         default=None, description="Путь до key файла для https"
     )
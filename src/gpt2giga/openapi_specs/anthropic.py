@@ -1,6 +1,6 @@
 """OpenAPI helpers for Anthropic-compatible endpoints."""
 
-from typing import Any, Dict
+from typing import Any
 
 from gpt2giga.openapi_specs.common import _request_body_oneof
 
@@ -25,9 +25,31 @@ ANTHROPIC_EXTRA_QUERY_DESCRIPTION = (
 )
 
 
-def anthropic_count_tokens_openapi_extra() -> Dict[str, Any]:
+# Shared by every request schema that accepts Anthropic SDK pass-through fields.
+# FastAPI only reads openapi_extra when it builds /openapi.json, so routes can
+# reference the same schema objects.
+_ANTHROPIC_SDK_EXTRA_PROPERTIES: dict[str, Any] = {
+    "extra_body": {
+        "type": "object",
+        "description": ANTHROPIC_EXTRA_BODY_DESCRIPTION,
+        "additionalProperties": True,
+    },
+    "extra_headers": {
+        "type": "object",
+        "description": ANTHROPIC_EXTRA_HEADERS_DESCRIPTION,
+        "additionalProperties": True,
+    },
+    "extra_query": {
+        "type": "object",
+        "description": ANTHROPIC_EXTRA_QUERY_DESCRIPTION,
+        "additionalProperties": True,
+    },
+}
+
+
+def anthropic_count_tokens_openapi_extra() -> dict[str, Any]:
     """OpenAPI extras for POST /messages/count_tokens."""
-    minimal_schema: Dict[str, Any] = {
+    minimal_schema: dict[str, Any] = {
         "title": "AnthropicCountTokensRequestMinimal",
         "type": "object",
         "description": ANTHROPIC_ADDITIONAL_PROPERTIES_NOTE,
@@ -43,7 +65,7 @@ def anthropic_count_tokens_openapi_extra() -> Dict[str, Any]:
         "additionalProperties": True,
     }
 
-    full_schema: Dict[str, Any] = {
+    full_schema: dict[str, Any] = {
         "title": "AnthropicCountTokensRequestFull",
         "type": "object",
         "description": ANTHROPIC_ADDITIONAL_PROPERTIES_NOTE,
@@ -62,21 +84,7 @@ def anthropic_count_tokens_openapi_extra() -> Dict[str, Any]:
                 "description": "Anthropic tools (input_schema). Included in token count.",
                 "items": {"type": "object", "additionalProperties": True},
             },
-            "extra_body": {
-                "type": "object",
-                "description": ANTHROPIC_EXTRA_BODY_DESCRIPTION,
-                "additionalProperties": True,
-            },
-            "extra_headers": {
-                "type": "object",
-                "description": ANTHROPIC_EXTRA_HEADERS_DESCRIPTION,
-                "additionalProperties": True,
-            },
-            "extra_query": {
-                "type": "object",
-                "description": ANTHROPIC_EXTRA_QUERY_DESCRIPTION,
-                "additionalProperties": True,
-            },
+            **_ANTHROPIC_SDK_EXTRA_PROPERTIES,
         },
         "additionalProperties": True,
     }
@@ -116,9 +124,9 @@ def anthropic_count_tokens_openapi_extra() -> Dict[str, Any]:
     )
 
 
-def anthropic_messages_openapi_extra() -> Dict[str, Any]:
+def anthropic_messages_openapi_extra() -> dict[str, Any]:
     """OpenAPI extras for POST /messages."""
-    minimal_schema: Dict[str, Any] = {
+    minimal_schema: dict[str, Any] = {
         "title": "AnthropicMessagesRequestMinimal",
         "type": "object",
         "description": ANTHROPIC_ADDITIONAL_PROPERTIES_NOTE,
@@ -146,7 +154,7 @@ def anthropic_messages_openapi_extra() -> Dict[str, Any]:
         "additionalProperties": True,
     }
 
-    full_schema: Dict[str, Any] = {
+    full_schema: dict[str, Any] = {
         "title": "AnthropicMessagesRequestFull",
         "type": "object",
         "description": ANTHROPIC_ADDITIONAL_PROPERTIES_NOTE,
@@ -189,21 +197,7 @@ def anthropic_messages_openapi_extra() -> Dict[str, Any]:
                 "description": "Structured output config (`format.type=json_schema`).",
                 "additionalProperties": True,
             },
-            "extra_body": {
-                "type": "object",
-                "description": ANTHROPIC_EXTRA_BODY_DESCRIPTION,
-                "additionalProperties": True,
-            },
-            "extra_headers": {
-                "type": "object",
-                "description": ANTHROPIC_EXTRA_HEADERS_DESCRIPTION,
-                "additionalProperties": True,
-            },
-            "extra_query": {
-                "type": "object",
-                "description": ANTHROPIC_EXTRA_QUERY_DESCRIPTION,
-                "additionalProperties": True,
-            },
+            **_ANTHROPIC_SDK_EXTRA_PROPERTIES,
             "metadata": {
                 "type": "object",
                 "description": "Anthropic metadata; accepted and ignored.",
@@ -307,9 +301,9 @@ def anthropic_messages_openapi_extra() -> Dict[str, Any]:
     )
 
 
-def anthropic_message_batches_openapi_extra() -> Dict[str, Any]:
+def anthropic_message_batches_openapi_extra() -> dict[str, Any]:
     """OpenAPI extras for POST /messages/batches."""
-    minimal_schema: Dict[str, Any] = {
+    minimal_schema: dict[str, Any] = {
         "title": "AnthropicMessageBatchesRequestMinimal",
         "type": "object",
         "description": ANTHROPIC_ADDITIONAL_PROPERTIES_NOTE,
@@ -344,7 +338,7 @@ def anthropic_message_batches_openapi_extra() -> Dict[str, Any]:
         "additionalProperties": True,
     }
 
-    full_schema: Dict[str, Any] = {
+    full_schema: dict[str, Any] = {
         "title": "AnthropicMessageBatchesRequestFull",
         "type": "object",
         "description": ANTHROPIC_ADDITIONAL_PROPERTIES_NOTE,
@@ -406,21 +400,7 @@ def anthropic_message_batches_openapi_extra() -> Dict[str, Any]:
                                     "description": "Structured output config (`format.type=json_schema`).",
                                     "additionalProperties": True,
                                 },
-                                "extra_body": {
-                                    "type": "object",
-                                    "description": ANTHROPIC_EXTRA_BODY_DESCRIPTION,
-                                    "additionalProperties": True,
-                                },
-                                "extra_headers": {
-                                    "type": "object",
-                                    "description": ANTHROPIC_EXTRA_HEADERS_DESCRIPTION,
-                                    "additionalProperties": True,
-                                },
-                                "extra_query": {
-                                    "type": "object",
-                                    "description": ANTHROPIC_EXTRA_QUERY_DESCRIPTION,
-                                    "additionalProperties": True,
-                                },
+                                **_ANTHROPIC_SDK_EXTRA_PROPERTIES,
                             },
                             "additionalProperties": True,
                         },
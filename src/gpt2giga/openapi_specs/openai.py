@@ -1,6 +1,6 @@
 """OpenAPI helpers for OpenAI-compatible endpoints."""
 
-from typing import Any, Dict
+from typing import Any
 
 from gpt2giga.openapi_specs.common import _request_body_oneof
 
@@ -25,9 +25,31 @@ SAFE_EXTRA_QUERY_DESCRIPTION = (
 )
 
 
-def chat_completions_openapi_extra() -> Dict[str, Any]:
+# Shared by every request schema that accepts OpenAI SDK pass-through fields.
+# FastAPI only reads openapi_extra when it builds /openapi.json, so routes can
+# reference the same schema objects.
+_OPENAI_SDK_EXTRA_PROPERTIES: dict[str, Any] = {
+    "extra_body": {
+        "type": "object",
+        "description": GIGACHAT_EXTRA_BODY_DESCRIPTION,
+        "additionalProperties": True,
+    },
+    "extra_headers": {
+        "type": "object",
+        "description": SAFE_EXTRA_HEADERS_DESCRIPTION,
+        "additionalProperties": True,
+    },
+    "extra_query": {
+        "type": "object",
+        "description": SAFE_EXTRA_QUERY_DESCRIPTION,
+        "additionalProperties": True,
+    },
+}
+
+
+def chat_completions_openapi_extra() -> dict[str, Any]:
     """OpenAPI extras for POST /chat/completions."""
-    minimal_schema: Dict[str, Any] = {
+    minimal_schema: dict[str, Any] = {
         "title": "ChatCompletionsRequestMinimal",
         "type": "object",
         "description": OPENAI_ADDITIONAL_PROPERTIES_NOTE,
@@ -85,7 +107,7 @@ def chat_completions_openapi_extra() -> Dict[str, Any]:
         "additionalProperties": True,
     }
 
-    full_schema: Dict[str, Any] = {
+    full_schema: dict[str, Any] = {
         "title": "ChatCompletionsRequestFull",
         "type": "object",
         "description": OPENAI_ADDITIONAL_PROPERTIES_NOTE,
@@ -150,21 +172,7 @@ def chat_completions_openapi_extra() -> Dict[str, Any]:
                 "description": "Force function/tool call (best effort).",
                 "oneOf": [{"type": "string"}, {"type": "object"}],
             },
-            "extra_body": {
-                "type": "object",
-                "description": GIGACHAT_EXTRA_BODY_DESCRIPTION,
-                "additionalProperties": True,
-            },
-            "extra_headers": {
-                "type": "object",
-                "description": SAFE_EXTRA_HEADERS_DESCRIPTION,
-                "additionalProperties": True,
-            },
-            "extra_query": {
-                "type": "object",
-                "description": SAFE_EXTRA_QUERY_DESCRIPTION,
-                "additionalProperties": True,
-            },
+            **_OPENAI_SDK_EXTRA_PROPERTIES,
             "user": {
                 "type": "string",
                 "description": "OpenAI abuse-monitoring metadata; accepted and ignored.",
@@ -278,9 +286,9 @@ def chat_completions_openapi_extra() -> Dict[str, Any]:
     )
 
 
-def embeddings_openapi_extra() -> Dict[str, Any]:
+def embeddings_openapi_extra() -> dict[str, Any]:
     """OpenAPI extras for POST /embeddings."""
-    minimal_schema: Dict[str, Any] = {
+    minimal_schema: dict[str, Any] = {
         "title": "EmbeddingsRequestMinimal",
         "type": "object",
         "description": OPENAI_ADDITIONAL_PROPERTIES_NOTE,
@@ -309,7 +317,7 @@ def embeddings_openapi_extra() -> Dict[str, Any]:
         "additionalProperties": True,
     }
 
-    full_schema: Dict[str, Any] = {
+    full_schema: dict[str, Any] = {
         "title": "EmbeddingsRequestFull",
         "type": "object",
         "description": OPENAI_ADDITIONAL_PROPERTIES_NOTE,
@@ -332,21 +340,12 @@ def embeddings_openapi_extra() -> Dict[str, Any]:
                 "type": "string",
                 "description": "OpenAI abuse-monitoring metadata; accepted and ignored.",
             },
+            **_OPENAI_SDK_EXTRA_PROPERTIES,
             "extra_body": {
                 "type": "object",
                 "description": "Accepted but ignored for embeddings.",
                 "additionalProperties": True,
             },
-            "extra_headers": {
-                "type": "object",
-                "description": SAFE_EXTRA_HEADERS_DESCRIPTION,
-                "additionalProperties": True,
-            },
-            "extra_query": {
-                "type": "object",
-                "description": SAFE_EXTRA_QUERY_DESCRIPTION,
-                "additionalProperties": True,
-            },
         },
         "additionalProperties": True,
     }
@@ -370,9 +369,9 @@ def embeddings_openapi_extra() -> Dict[str, Any]:
     )
 
 
-def responses_openapi_extra() -> Dict[str, Any]:
+def responses_openapi_extra() -> dict[str, Any]:
     """OpenAPI extras for POST /responses."""
-    minimal_schema: Dict[str, Any] = {
+    minimal_schema: dict[str, Any] = {
         "title": "ResponsesRequestMinimal",
         "type": "object",
         "description": OPENAI_ADDITIONAL_PROPERTIES_NOTE,
@@ -395,7 +394,7 @@ def responses_openapi_extra() -> Dict[str, Any]:
         "additionalProperties": True,
     }
 
-    full_schema: Dict[str, Any] = {
+    full_schema: dict[str, Any] = {
         "title": "ResponsesRequestFull",
         "type": "object",
         "description": OPENAI_ADDITIONAL_PROPERTIES_NOTE,
@@ -442,21 +441,7 @@ def responses_openapi_extra() -> Dict[str, Any]:
                 "description": "OpenAI storage/query metadata; accepted and ignored.",
                 "additionalProperties": True,
             },
-            "extra_body": {
-                "type": "object",
-                "description": GIGACHAT_EXTRA_BODY_DESCRIPTION,
-                "additionalProperties": True,
-            },
-            "extra_headers": {
-                "type": "object",
-                "description": SAFE_EXTRA_HEADERS_DESCRIPTION,
-                "additionalProperties": True,
-            },
-            "extra_query": {
-                "type": "object",
-                "description": SAFE_EXTRA_QUERY_DESCRIPTION,
-                "additionalProperties": True,
-            },
+            **_OPENAI_SDK_EXTRA_PROPERTIES,
             "previous_response_id": {
                 "type": "string",
                 "description": (
@@ -546,7 +531,7 @@ def responses_openapi_extra() -> Dict[str, Any]:
     )
 
 
-def files_openapi_extra() -> Dict[str, Any]:
+def files_openapi_extra() -> dict[str, Any]:
     """OpenAPI extras for POST /files."""
     return {
         "requestBody": {
@@ -597,9 +582,9 @@ def files_openapi_extra() -> Dict[str, Any]:
     }
 
 
-def batches_openapi_extra() -> Dict[str, Any]:
+def batches_openapi_extra() -> dict[str, Any]:
     """OpenAPI extras for POST /batches."""
-    minimal_schema: Dict[str, Any] = {
+    minimal_schema: dict[str, Any] = {
         "title": "BatchCreateRequestMinimal",
         "type": "object",
         "required": ["completion_window", "endpoint", "input_file_id"],
@@ -626,7 +611,7 @@ def batches_openapi_extra() -> Dict[str, Any]:
         "additionalProperties": True,
     }
 
-    full_schema: Dict[str, Any] = {
+    full_schema: dict[str, Any] = {
         "title": "BatchCreateRequestFull",
         "type": "object",
         "required": ["completion_window", "endpoint", "input_file_id"],
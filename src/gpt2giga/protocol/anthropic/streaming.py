@@ -99,7 +99,7 @@ async def _stream_anthropic_generator(
                     if await request.is_disconnected():
                         if logger:
                             logger.info(
-                                f"[{rquid}] Client disconnected during streaming"
+                                "[{}] Client disconnected during streaming", rquid
                             )
                         break
 
@@ -1,3 +1,4 @@
+import asyncio
 import base64
 import hashlib
 import ipaddress
@@ -5,6 +6,7 @@ import re
 import socket
 import time
 import uuid
+from collections import OrderedDict
 from typing import Optional, NamedTuple, Literal
 from urllib.parse import urlsplit, urlunsplit, urljoin
 
@@ -25,6 +27,16 @@ from gpt2giga.constants import (
     SUPPORTED_TEXT_MIME_TYPES as CONST_SUPPORTED_TEXT_MIME_TYPES,
 )
 
+_BASE64_DATA_URL_RE = re.compile(r"data:(.+);base64,(.+)")
+_BASE64_DATA_URL_PREFIX = "data:"
+_BASE64_DATA_URL_MARKER = ";base64,"
+# hashlib releases the GIL, so hashing large data URLs in a thread frees the loop.
+_THREAD_HASH_MIN_CHARS = 64 * 1024
+
+
+def _sha256_hexdigest(value: str) -> str:
+    return hashlib.sha256(value.encode()).hexdigest()
+
 
 class CacheEntry(NamedTuple):
     """Запись кэша с TTL"""
@@ -67,7 +79,8 @@ class AttachmentProcessor:
         max_text_file_size_bytes: int = DEFAULT_MAX_TEXT_FILE_SIZE_BYTES,
     ):
         self.logger = logger
-        self._cache: dict[str, CacheEntry] = {}
+        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future[Optional[str]]] = {}
         self._max_cache_size = max_cache_size
         self._cache_ttl = cache_ttl_seconds
         self._max_audio_file_size_bytes = max_audio_file_size_bytes
@@ -103,27 +116,15 @@ class AttachmentProcessor:
             del self._cache[key]
             return None
 
+        self._cache.move_to_end(key)
         return entry.file_id
 
     def _set_cached(self, key: str, file_id: str) -> None:
         """Добавляет значение в кэш с LRU-eviction"""
-        # LRU eviction: удаляем старые записи если кэш переполнен
-        if len(self._cache) >= self._max_cache_size:
-            # Удаляем просроченные записи
-            now = time.time()
-            expired_keys = [k for k, v in self._cache.items() if v.expires_at < now]
-            for k in expired_keys:
-                del self._cache[k]
-
-            # Если всё ещё переполнен, удаляем самые старые (FIFO как приближение LRU)
-            if len(self._cache) >= self._max_cache_size:
-                # Удаляем 10% самых старых записей
-                items_to_remove = max(1, self._max_cache_size // 10)
-                sorted_keys = sorted(
-                    self._cache.keys(), key=lambda k: self._cache[k].expires_at
-                )
-                for k in sorted_keys[:items_to_remove]:
-                    del self._cache[k]
+        self._cache.pop(key, None)
+        # LRU eviction: порядок словаря совпадает с порядком обращений
+        while self._cache and len(self._cache) >= self._max_cache_size:
+            self._cache.popitem(last=False)
 
         self._cache[key] = CacheEntry(
             file_id=file_id, expires_at=time.time() + self._cache_ttl
@@ -148,10 +149,28 @@ class AttachmentProcessor:
 
     @staticmethod
     def _extract_main_content_type(content_type: str) -> str:
-        return (content_type or "").split(";")[0].strip().lower()
+        return (content_type or "").partition(";")[0].strip().lower()
+
+    @staticmethod
+    def _split_base64_data_url(url: str) -> tuple[str, str] | None:
+        """Return ``(media type, payload)`` for a base64 data URL."""
+        # Plain single-line data URLs avoid backtracking over the whole payload.
+        if url.startswith(_BASE64_DATA_URL_PREFIX) and "\n" not in url:
+            marker = url.rfind(_BASE64_DATA_URL_MARKER)
+            payload_start = marker + len(_BASE64_DATA_URL_MARKER)
+            if marker > len(_BASE64_DATA_URL_PREFIX) and payload_start < len(url):
+                return url[len(_BASE64_DATA_URL_PREFIX) : marker], url[payload_start:]
+        match = _BASE64_DATA_URL_RE.search(url)
+        return (match.group(1), match.group(2)) if match else None
 
     @staticmethod
     def _estimate_base64_size(encoded: str) -> int:
+        # Well-formed payloads need no strip/rstrip copies of the whole string.
+        if not (
+            encoded[:1].isspace() or encoded[-1:].isspace() or encoded.endswith("===")
+        ):
+            padding = 2 if encoded.endswith("==") else int(encoded.endswith("="))
+            return (len(encoded) * 3) // 4 - padding
         value = encoded.strip()
         if not value:
             return 0
@@ -180,7 +199,8 @@ class AttachmentProcessor:
             return "text"
 
         if filename:
-            ext = filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
+            _, dot, ext = filename.rpartition(".")
+            ext = ext.lower() if dot else ""
             if ext in self.SUPPORTED_AUDIO_EXTENSIONS:
                 return "audio"
             if ext in self.SUPPORTED_IMAGE_EXTENSIONS:
@@ -339,18 +359,51 @@ class AttachmentProcessor:
     ) -> Optional[UploadResult]:
         """Загружает файл в GigaChat и возвращает file_id и метаданные."""
 
-        base64_matches = re.search(r"data:(.+);base64,(.+)", image_url)
-        hashed = hashlib.sha256(image_url.encode()).hexdigest()
+        if len(image_url) < _THREAD_HASH_MIN_CHARS:
+            hashed = _sha256_hexdigest(image_url)
+        else:
+            hashed = await anyio.to_thread.run_sync(_sha256_hexdigest, image_url)
 
         cached_id = self._get_cached(hashed)
+        if cached_id is None and hashed in self._inflight:
+            # Ждём параллельную загрузку того же файла вместо повторной
+            cached_id = await asyncio.shield(self._inflight[hashed])
         if cached_id is not None:
             self.logger.debug(f"Image found in cache: {hashed[:16]}...")
             return UploadResult(cached_id, 0, "unknown")
 
+        pending: asyncio.Future[Optional[str]] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._inflight[hashed] = pending
+        result = None
+        try:
+            result = await self._upload_uncached(
+                giga_client,
+                image_url,
+                hashed,
+                filename,
+                max_audio_image_total_remaining,
+            )
+            return result
+        finally:
+            if self._inflight.get(hashed) is pending:
+                del self._inflight[hashed]
+            pending.set_result(result.file_id if result else None)
+
+    async def _upload_uncached(
+        self,
+        giga_client: GigaChat,
+        image_url: str,
+        hashed: str,
+        filename: str | None,
+        max_audio_image_total_remaining: int | None,
+    ) -> Optional[UploadResult]:
+        base64_parts = self._split_base64_data_url(image_url)
         try:
-            if base64_matches:
-                content_type = self._extract_main_content_type(base64_matches.group(1))
-                image_str = base64_matches.group(2)
+            if base64_parts:
+                content_type = self._extract_main_content_type(base64_parts[0])
+                image_str = base64_parts[1]
                 file_kind = self._classify_file_kind(content_type, filename)
                 if file_kind == "unknown":
                     self._raise_unsupported_media_type(content_type, filename)
@@ -462,7 +515,7 @@ class AttachmentProcessor:
                     if stream_cm is not None:
                         await stream_cm.__aexit__(None, None, None)
 
-            ext = content_type.split("/")[-1] or "jpg"
+            ext = content_type.rpartition("/")[2] or "jpg"
             filename = filename or f"{uuid.uuid4()}.{ext}"
             self.logger.info(f"Uploading file to GigaChat... with extension {ext}")
             file = await giga_client.aupload_file((filename, content_bytes))
@@ -13,10 +13,14 @@ from gigachat.models import (
     Messages,
     MessagesRole,
 )
+from pydantic import TypeAdapter
 
 from gpt2giga.common.client_params import ClientCompatibilityError
 from gpt2giga.common.content_utils import ensure_json_object_str
-from gpt2giga.common.debug_logging import log_debug_payload
+from gpt2giga.common.debug_logging import (
+    is_debug_logging_enabled,
+    log_debug_payload,
+)
 from gpt2giga.common.json_schema import (
     normalize_json_schema,
     normalize_tool_parameters_schema,
@@ -43,6 +47,8 @@ from gpt2giga.protocol.request.params import (
     sanitize_openai_responses_parameters,
 )
 
+_MESSAGES_ADAPTER = TypeAdapter(List[Messages])
+
 
 class RequestTransformer:
     """Transformer for converting OpenAI requests to GigaChat format."""
@@ -59,6 +65,13 @@ class RequestTransformer:
         self.config = config
         self.logger = logger
         self.attachment_processor = attachment_processor
+        proxy_settings = config.proxy_settings
+        self._enable_images = getattr(proxy_settings, "enable_images", False)
+        self._max_audio_image_total = getattr(
+            proxy_settings,
+            "max_audio_image_total_size_bytes",
+            DEFAULT_MAX_AUDIO_IMAGE_TOTAL_SIZE_BYTES,
+        )
 
     def _map_role(self, role: str, is_first: bool) -> str:
         """Maps a role to a valid GigaChat role."""
@@ -83,9 +96,12 @@ class RequestTransformer:
         tool_name_by_call_id: dict[str, str] = {}
 
         size_totals = {"audio_image_total": 0}
+        logger = self.logger
+        debug_enabled = is_debug_logging_enabled(self.config)
 
         for i, message in enumerate(messages):
-            self.logger.debug(f"Processing message {i}: role={message.get('role')}")
+            if debug_enabled:
+                logger.debug(f"Processing message {i}: role={message.get('role')}")
 
             original_role = message.get("role", "user")
 
@@ -137,38 +153,37 @@ class RequestTransformer:
                 message["content"] = remaining_content
 
             # Process tool_calls
-            if "tool_calls" in message and message["tool_calls"]:
-                tool_call = message["tool_calls"][0]
+            tool_calls = message.get("tool_calls")
+            function_call = message.get("function_call")
+            if tool_calls:
+                tool_call = tool_calls[0]
                 if isinstance(tool_call, dict):
                     tool_call_id = self._extract_tool_call_id(tool_call)
                     self._set_backend_state_id(message, tool_call_id)
-                    message["function_call"] = tool_call.get("function")
-                    if isinstance(message.get("function_call"), dict):
-                        self._normalize_message_function_call(message["function_call"])
+                    function_call = tool_call.get("function")
+                    message["function_call"] = function_call
+                    if isinstance(function_call, dict):
+                        self._normalize_message_function_call(function_call)
                         self._track_pending_tool_call(
-                            message["function_call"],
+                            function_call,
                             tool_call_id,
                             pending_tool_calls,
                             tool_name_by_call_id,
                         )
-                elif isinstance(message.get("function_call"), dict):
-                    self._normalize_message_function_call(message["function_call"])
+                elif isinstance(function_call, dict):
+                    self._normalize_message_function_call(function_call)
                     self._track_pending_tool_call(
-                        message["function_call"],
+                        function_call,
                         self._extract_tool_call_id(message),
                         pending_tool_calls,
                         tool_name_by_call_id,
                     )
-            elif (
-                message.get("function_call")
-                and isinstance(message["function_call"], dict)
-                and message["function_call"].get("name")
-            ):
+            elif isinstance(function_call, dict) and function_call.get("name"):
                 tool_call_id = self._extract_tool_call_id(message)
                 self._set_backend_state_id(message, tool_call_id)
-                self._normalize_message_function_call(message["function_call"])
+                self._normalize_message_function_call(function_call)
                 self._track_pending_tool_call(
-                    message["function_call"],
+                    function_call,
                     tool_call_id,
                     pending_tool_calls,
                     tool_name_by_call_id,
@@ -207,7 +222,7 @@ class RequestTransformer:
 
         # Check attachment limits
         if attachment_count > 10:
-            limit_attachments(transformed_messages, max_total=10, logger=self.logger)
+            limit_attachments(transformed_messages, max_total=10, logger=logger)
 
         return transformed_messages
 
@@ -343,12 +358,7 @@ class RequestTransformer:
         max_attachments = 2
 
         processor = self.attachment_processor
-        enable_images = getattr(self.config.proxy_settings, "enable_images", False)
-        max_audio_image_total = getattr(
-            self.config.proxy_settings,
-            "max_audio_image_total_size_bytes",
-            DEFAULT_MAX_AUDIO_IMAGE_TOTAL_SIZE_BYTES,
-        )
+        enable_images = self._enable_images
         logger = self.logger
 
         for content_part in content_parts:
@@ -365,37 +375,9 @@ class RequestTransformer:
                 url = content_part["image_url"].get("url")
                 if url is not None:
                     if giga_client:
-                        if hasattr(processor, "upload_file_with_meta"):
-                            remaining = max_audio_image_total
-                            if size_totals is not None:
-                                remaining = max(
-                                    0,
-                                    max_audio_image_total
-                                    - size_totals.get("audio_image_total", 0),
-                                )
-                            upload_result = await processor.upload_file_with_meta(
-                                giga_client,
-                                url,
-                                max_audio_image_total_remaining=remaining,
-                            )
-                            if upload_result:
-                                attachments.append(upload_result.file_id)
-                                if (
-                                    upload_result.file_kind in {"audio", "image"}
-                                    and size_totals is not None
-                                ):
-                                    size_totals["audio_image_total"] = (
-                                        size_totals.get("audio_image_total", 0)
-                                        + upload_result.file_size_bytes
-                                    )
-                                logger.info(
-                                    f"Added attachment: {upload_result.file_id}"
-                                )
-                        else:
-                            file_id = await processor.upload_file(giga_client, url)
-                            if file_id:
-                                attachments.append(file_id)
-                                logger.info(f"Added attachment: {file_id}")
+                        await self._upload_content_attachment(
+                            giga_client, url, attachments, size_totals
+                        )
                     else:
                         logger.warning("giga_client not provided for image upload")
 
@@ -403,38 +385,13 @@ class RequestTransformer:
                 filename = content_part["file"].get("filename")
                 file_data = content_part["file"].get("file_data")
                 if giga_client:
-                    if hasattr(processor, "upload_file_with_meta"):
-                        remaining = max_audio_image_total
-                        if size_totals is not None:
-                            remaining = max(
-                                0,
-                                max_audio_image_total
-                                - size_totals.get("audio_image_total", 0),
-                            )
-                        upload_result = await processor.upload_file_with_meta(
-                            giga_client,
-                            file_data,
-                            filename,
-                            max_audio_image_total_remaining=remaining,
-                        )
-                        if upload_result:
-                            attachments.append(upload_result.file_id)
-                            if (
-                                upload_result.file_kind in {"audio", "image"}
-                                and size_totals is not None
-                            ):
-                                size_totals["audio_image_total"] = (
-                                    size_totals.get("audio_image_total", 0)
-                                    + upload_result.file_size_bytes
-                                )
-                            logger.info(f"Added attachment: {upload_result.file_id}")
-                    else:
-                        file_id = await processor.upload_file(
-                            giga_client, file_data, filename
-                        )
-                        if file_id:
-                            attachments.append(file_id)
-                            logger.info(f"Added attachment: {file_id}")
+                    await self._upload_content_attachment(
+                        giga_client,
+                        file_data,
+                        attachments,
+                        size_totals,
+                        filename=filename,
+                    )
                 else:
                     logger.warning("giga_client not provided for file upload")
 
@@ -446,6 +403,44 @@ class RequestTransformer:
 
         return texts, attachments
 
+    async def _upload_content_attachment(
+        self,
+        giga_client: GigaChat,
+        source: str,
+        attachments: List[str],
+        size_totals: Optional[Dict[str, int]],
+        filename: Optional[str] = None,
+    ) -> None:
+        """Uploads one image/file content part and records its file id."""
+        processor = self.attachment_processor
+        if not hasattr(processor, "upload_file_with_meta"):
+            file_id = await processor.upload_file(
+                giga_client, source, filename=filename
+            )
+            if file_id:
+                attachments.append(file_id)
+                self.logger.info("Added attachment: {}", file_id)
+            return
+
+        remaining = self._max_audio_image_total
+        if size_totals is not None:
+            remaining = max(0, remaining - size_totals.get("audio_image_total", 0))
+        upload_result = await processor.upload_file_with_meta(
+            giga_client,
+            source,
+            filename=filename,
+            max_audio_image_total_remaining=remaining,
+        )
+        if not upload_result:
+            return
+
+        attachments.append(upload_result.file_id)
+        if upload_result.file_kind in {"audio", "image"} and size_totals is not None:
+            size_totals["audio_image_total"] = (
+                size_totals.get("audio_image_total", 0) + upload_result.file_size_bytes
+            )
+        self.logger.info("Added attachment: {}", upload_result.file_id)
+
     def _transform_common_parameters(self, data: Dict) -> Dict:
         """Common parameter transformation logic for Chat Completions and Responses API."""
         transformed = data.copy()
@@ -934,6 +929,13 @@ class RequestTransformer:
         else:
             arguments = raw_arguments
         name = map_tool_name_to_gigachat(message.get("name"))
+        if isinstance(name, str) and isinstance(arguments, dict):
+            return {
+                "role": "assistant",
+                "content": "",
+                "function_call": {"name": name, "arguments": arguments},
+            }
+        # Let the SDK models coerce or reject anything else.
         return Messages(
             role=MessagesRole.ASSISTANT,
             function_call=FunctionCall(name=name, arguments=arguments),
@@ -985,9 +987,9 @@ class RequestTransformer:
             Messages.model_validate(m) for m in transformed_data["messages"]
         ]
         collapsed_objs = collapse_user_messages(messages_objs)
-        transformed_data["messages"] = [
-            m.model_dump(exclude_none=True) for m in collapsed_objs
-        ]
+        transformed_data["messages"] = _MESSAGES_ADAPTER.dump_python(
+            collapsed_objs, exclude_none=True
+        )
 
         msg_count = len(transformed_data.get("messages", []))
         has_functions = bool(transformed_data.get("functions"))
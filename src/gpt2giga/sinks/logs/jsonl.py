@@ -31,6 +31,7 @@ class JsonlTrafficLogSink:
                 traffic_event_to_json_dict(event),
                 ensure_ascii=False,
                 sort_keys=True,
+                separators=(",", ":"),
             )
             for event in events
         )
@@ -391,6 +391,20 @@ def test_run_server(monkeypatch):
     gpt2giga.api_server.run()
 
 
+def test_run_server_passes_event_loop_to_uvicorn(monkeypatch):
+    import gpt2giga.api_server
+    import uvicorn
+
+    captured = {}
+    monkeypatch.setenv("GPT2GIGA_EVENT_LOOP", "asyncio")
+    monkeypatch.setattr(uvicorn, "run", lambda *args, **kwargs: captured.update(kwargs))
+    monkeypatch.setattr("gpt2giga.api_server.check_port_available", lambda h, p: True)
+
+    gpt2giga.api_server.run()
+
+    assert captured["loop"] == "asyncio"
+
+
 def test_run_server_port_in_use(monkeypatch):
     """run() must exit with error when port is already in use."""
     import pytest
@@ -1,8 +1,17 @@
 import logging
+import re
 
 import loguru
+import pytest
 
-from gpt2giga.logger import redact_sensitive, redact_sensitive_data, setup_logger
+from gpt2giga.constants import SENSITIVE_KEYS, SENSITIVE_TRIGGERS
+from gpt2giga.logger import (
+    _format_structured_extra,
+    redact_sensitive,
+    redact_sensitive_data,
+    rquid_context,
+    setup_logger,
+)
 
 
 def test_init_logger_info_level():
@@ -57,6 +66,12 @@ def test_redact_bearer_token():
     assert "Bearer ***" in result
 
 
+def test_redact_kv_eq_and_bearer_in_one_message():
+    msg = "GET /v1?token=tok_abc&x=1 Authorization: Bearer eyJabc password=pw"
+    result = redact_sensitive(msg)
+    assert result == ("GET /v1?token=***&x=1 Authorization: Bearer *** password=***")
+
+
 def test_redact_authorization_header():
     msg = '{"authorization": "Bearer tok123"}'
     result = redact_sensitive(msg)
@@ -76,6 +91,30 @@ def test_redact_no_sensitive_data():
     assert result == msg
 
 
+def test_sensitive_triggers_cover_every_sensitive_key():
+    for key in SENSITIVE_KEYS:
+        assert any(trigger in key for trigger in SENSITIVE_TRIGGERS), key
+
+
+@pytest.mark.parametrize(
+    ("msg", "expected"),
+    [
+        ("authorİzation=hunter2", "authorİzation=***"),
+        ('"paſswd": "hunter2"', '"paſswd": "***"'),
+        ("Привет, passwd=hunter2", "Привет, passwd=***"),
+    ],
+)
+def test_redact_non_ascii_case_folded_keys(msg, expected):
+    # IGNORECASE matching folds these characters onto ASCII key letters.
+    assert redact_sensitive(msg) == expected
+
+
+def test_redact_overlapping_key_prefixes():
+    msg = "secret_key=sk1 secret=s2 {'x-api-key': 'k3'}"
+    result = redact_sensitive(msg)
+    assert result == "secret_key=*** secret=*** {'x-api-key': '***'}"
+
+
 def test_redact_case_insensitive():
     msg = "API_KEY=mykey123"
     result = redact_sensitive(msg)
@@ -107,6 +146,72 @@ def test_setup_logger_with_redaction_disabled(tmp_path):
     assert isinstance(logger, loguru._logger.Logger)
 
 
+def test_setup_logger_patcher_binds_rquid_and_redacts(tmp_path):
+    redacted_file = tmp_path / "redacted.log"
+    logger = setup_logger("DEBUG", log_file=str(redacted_file), enable_redaction=True)
+    token = rquid_context.set("rquid-redacted")
+    try:
+        logger.bind(payload={"api_key": "sk-extra"}).info("api_key=sk-message")
+        logger.complete()
+    finally:
+        rquid_context.reset(token)
+
+    content = redacted_file.read_text(encoding="utf-8")
+    assert "rquid-redacted" in content
+    assert "sk-message" not in content
+    assert "sk-extra" not in content
+
+    plain_file = tmp_path / "plain.log"
+    logger = setup_logger("DEBUG", log_file=str(plain_file), enable_redaction=False)
+    logger.info("api_key=sk-message")
+    logger.complete()
+
+    assert "api_key=sk-message" in plain_file.read_text(encoding="utf-8")
+
+
+def test_format_structured_extra_skips_rquid_only_records():
+    assert _format_structured_extra({}) == ""
+    assert _format_structured_extra({"rquid": "abc"}) == ""
+    assert _format_structured_extra({"rquid": "abc", "status": None}) == ""
+    assert _format_structured_extra({"status": 200}) == ' | {{"status": 200}}'
+    assert _format_structured_extra({"tag": "<red>"}) == ' | {{"tag": "\\<red>"}}'
+
+
+@pytest.mark.parametrize(
+    ("extra", "expected"),
+    [
+        ({"rquid": "a", "status": 200}, ' | {{"status": 200}}'),
+        ({"rquid": "a", "cmp": "1 < 2 > 0"}, ' | {{"cmp": "1 < 2 > 0"}}'),
+        (
+            {"rquid": "a", "tag": "<red>x</red>"},
+            ' | {{"tag": "\\<red>x\\</red>"}}',
+        ),
+        (
+            {"rquid": "a", "payload": {"k": "<level>"}},
+            ' | {{"payload": {{"k": "\\<level>"}}}}',
+        ),
+        (
+            {"status": 200, "note": "<fg #fff>hi</fg #fff>"},
+            ' | {{"status": 200, "note": "\\<fg #fff>hi\\</fg #fff>"}}',
+        ),
+        ({"x": None, "rquid": "a"}, ""),
+        ({"a": 1, "b": None}, ' | {{"a": 1}}'),
+    ],
+)
+def test_format_structured_extra_escapes_markup_for_every_shape(extra, expected):
+    assert _format_structured_extra(extra) == expected
+
+
+def test_setup_logger_formats_record_timestamp(tmp_path):
+    log_file = tmp_path / "test.log"
+    logger = setup_logger("DEBUG", log_file=str(log_file), enable_redaction=False)
+    logger.info("timestamped")
+    logger.complete()
+
+    line = log_file.read_text(encoding="utf-8").splitlines()[-1]
+    assert re.match(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} \| INFO", line)
+
+
 def test_structured_payload_tags_are_logged_as_text(tmp_path):
     log_file = tmp_path / "test.log"
     logger = setup_logger("DEBUG", log_file=str(log_file), enable_redaction=False)
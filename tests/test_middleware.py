@@ -2,6 +2,7 @@ import asyncio
 from datetime import datetime, timezone
 from types import SimpleNamespace
 from unittest.mock import MagicMock
+import uuid
 
 from fastapi import FastAPI
 from fastapi import Request
@@ -15,8 +16,8 @@ from gpt2giga.core.context import fingerprint_sensitive_value
 from gpt2giga.core.context import get_request_context
 from gpt2giga.models.config import ProxyConfig
 from gpt2giga.models.config import ProxySettings
-from gpt2giga.middlewares.rquid_context import RquidMiddleware
-from gpt2giga.middlewares.pass_token import PassTokenMiddleware
+from gpt2giga.middlewares.rquid_context import RquidMiddleware, _new_request_id
+from gpt2giga.middlewares.pass_token import PassTokenMiddleware, _bearer_token
 from gpt2giga.middlewares.path_normalizer import PathNormalizationMiddleware
 from gpt2giga.middlewares.request_validation import RequestValidationMiddleware
 from gpt2giga.sinks.logs.emission import wrap_traffic_log_body_iterator
@@ -163,6 +164,26 @@ def test_path_norm_keeps_gateway_version_before_gemini_v1beta_prefix():
     assert v2_response.json()["version"] == "v2"
 
 
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        ("/v1/chat/completions", None),
+        ("/chat/completions", None),
+        ("/v1", None),
+        ("/v1/v1/messages", "/v1/messages"),
+        ("/v1//v1/messages", "/v1/messages"),
+        ("/v2/v1/messages", "/v2/messages"),
+        ("/proxy/v1/models", "/v1/models"),
+        ("//v1/models", None),
+        ("/unknown/path", None),
+    ],
+)
+def test_path_norm_default_roots_fast_path_matches_full_scan(path, expected):
+    middleware = PathNormalizationMiddleware(app=None)
+
+    assert middleware._normalize_path(path) == expected
+
+
 def test_pass_token_middleware(monkeypatch):
     test_app = FastAPI()
     test_app.add_middleware(PassTokenMiddleware)
@@ -231,6 +252,21 @@ def test_pass_token_middleware(monkeypatch):
     test_app.state.logger.warning.assert_not_called()
 
 
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (b"Bearer token-1", "token-1"),
+        (b"bearer  token-2", "token-2"),
+        (b"Bearer ", None),
+        (b"Basic abc", None),
+    ],
+)
+def test_pass_token_bearer_token_parsing(header, expected):
+    scope = {"headers": [(b"authorization", header)]}
+
+    assert _bearer_token(scope) == expected
+
+
 def test_rquid_middleware_sets_request_context_and_header():
     test_app = FastAPI()
     test_app.add_middleware(RquidMiddleware)
@@ -281,6 +317,17 @@ def test_rquid_middleware_sets_request_context_and_header():
     assert "local-secret" not in data["api_key_hash"]
 
 
+def test_new_request_id_is_canonical_uuid4():
+    request_ids = {_new_request_id() for _ in range(64)}
+
+    assert len(request_ids) == 64
+    for request_id in request_ids:
+        parsed = uuid.UUID(request_id)
+        assert str(parsed) == request_id
+        assert parsed.version == 4
+        assert parsed.variant == uuid.RFC_4122
+
+
 def test_sensitive_fingerprint_is_stable_and_opaque():
     first = fingerprint_sensitive_value("local-secret")
 
@@ -365,6 +412,36 @@ def test_read_request_json_updates_request_context_model():
     assert response.json() == {"model_requested": "GigaChat-2-Max"}
 
 
+@pytest.mark.parametrize(
+    ("body", "message"),
+    [
+        (b"", "Request body is empty (expected JSON)."),
+        (b" \r\n\t", "Request body is empty (expected JSON)."),
+        (b"{", "Invalid JSON body: Expecting property name enclosed in double quotes"),
+        (b"[1]", "Invalid JSON body: expected an object at the top level."),
+    ],
+)
+def test_read_request_json_rejects_empty_and_invalid_bodies(body, message):
+    test_app = FastAPI()
+
+    @test_app.post("/chat/completions")
+    async def read_body(request: Request):
+        return await read_request_json(request)
+
+    client = TestClient(test_app)
+    response = client.post("/chat/completions", content=body)
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == {
+        "error": {
+            "message": message,
+            "type": "invalid_request_error",
+            "param": None,
+            "code": "invalid_json",
+        }
+    }
+
+
 def test_rquid_middleware_skips_noop_sink_dispatch(monkeypatch):
     test_app = FastAPI()
     test_app.state.traffic_log_sink = NoopTrafficLogSink()
@@ -681,6 +758,46 @@ def test_rquid_middleware_emits_traffic_event_for_validation_error():
     assert event.metadata["lifecycle"] == "request_completed"
 
 
+@pytest.mark.parametrize(
+    ("method", "content_length", "expected_status"),
+    [
+        ("POST", "5", 413),
+        ("PUT", "5", 413),
+        ("POST", "1", 200),
+        ("POST", "abc", 200),
+        ("DELETE", "5", 200),
+    ],
+)
+async def test_request_validation_checks_content_length_for_body_methods(
+    method, content_length, expected_status
+):
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    middleware = RequestValidationMiddleware(app, max_body_bytes=1)
+    await middleware(
+        {
+            "type": "http",
+            "method": method,
+            "path": "/v1/chat/completions",
+            "headers": [(b"content-length", content_length.encode("latin-1"))],
+        },
+        receive,
+        send,
+    )
+
+    assert sent[0]["status"] == expected_status
+
+
 async def test_traffic_log_body_iterator_emits_stream_completed():
     sink = RecordingTrafficSink()
     context = RequestContext(
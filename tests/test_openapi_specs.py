@@ -1,9 +1,15 @@
+import copy
+
+from gpt2giga.app.factory import create_app
+from gpt2giga.models.config import ProxyConfig
 from gpt2giga.openapi_specs.anthropic import (
+    _ANTHROPIC_SDK_EXTRA_PROPERTIES,
     anthropic_count_tokens_openapi_extra,
     anthropic_message_batches_openapi_extra,
     anthropic_messages_openapi_extra,
 )
 from gpt2giga.openapi_specs.openai import (
+    _OPENAI_SDK_EXTRA_PROPERTIES,
     chat_completions_openapi_extra,
     embeddings_openapi_extra,
     responses_openapi_extra,
@@ -86,3 +92,41 @@ def test_openapi_anthropic_documents_count_tokens_and_disabled_batches_policy():
     assert "default public Anthropic router omits batch routes" in (
         _request_body_description(batches_extra)
     )
+
+
+def test_openapi_sdk_extra_properties_are_shared_between_routes():
+    openai_properties = [
+        _full_schema(extra())["properties"]
+        for extra in (chat_completions_openapi_extra, responses_openapi_extra)
+    ]
+    anthropic_properties = [
+        _full_schema(extra())["properties"]
+        for extra in (
+            anthropic_messages_openapi_extra,
+            anthropic_count_tokens_openapi_extra,
+        )
+    ]
+
+    for properties in (openai_properties, anthropic_properties):
+        for field in ("extra_body", "extra_headers", "extra_query"):
+            schemas = [route_properties[field] for route_properties in properties]
+            assert len({id(schema) for schema in schemas}) == 1
+
+    embeddings_properties = _full_schema(embeddings_openapi_extra())["properties"]
+    assert (
+        embeddings_properties["extra_body"]["description"]
+        == "Accepted but ignored for embeddings."
+    )
+    assert (
+        embeddings_properties["extra_headers"] is openai_properties[0]["extra_headers"]
+    )
+
+
+def test_openapi_generation_does_not_mutate_shared_sdk_properties():
+    before = copy.deepcopy(
+        (_OPENAI_SDK_EXTRA_PROPERTIES, _ANTHROPIC_SDK_EXTRA_PROPERTIES)
+    )
+
+    create_app(config=ProxyConfig()).openapi()
+
+    assert (_OPENAI_SDK_EXTRA_PROPERTIES, _ANTHROPIC_SDK_EXTRA_PROPERTIES) == before
@@ -1,3 +1,4 @@
+import asyncio
 import base64
 import ipaddress
 import time
@@ -68,6 +69,16 @@ async def test_attachment_processor_base64_and_cache(monkeypatch):
     assert client.calls == before
 
 
+async def test_attachment_processor_caches_large_base64_upload():
+    client = DummyClient()
+    p = AttachmentProcessor(logger=logger)
+    data_url = "data:image/jpeg;base64," + base64.b64encode(b"\xff" * 96_000).decode()
+
+    assert await p.upload_file(client, data_url) == "f1"
+    assert await p.upload_file(client, data_url) == "f1"
+    assert client.calls == 1
+
+
 async def test_attachment_processor_async_httpx(monkeypatch):
     """Тест async HTTP клиента для скачивания изображений"""
 
@@ -139,6 +150,112 @@ async def test_attachment_processor_cache_lru_eviction(monkeypatch):
     assert len(p._cache) <= 3
 
 
+async def test_attachment_processor_cache_evicts_least_recently_used():
+    client = DummyClient()
+    p = AttachmentProcessor(logger=logger, max_cache_size=2)
+    urls = [
+        f"data:image/jpeg;base64,{base64.b64encode(name.encode()).decode()}"
+        for name in ("first", "second", "third")
+    ]
+
+    await p.upload_file(client, urls[0])
+    await p.upload_file(client, urls[1])
+    # Cache hit marks the first entry as recently used.
+    await p.upload_file(client, urls[0])
+    await p.upload_file(client, urls[2])
+    assert client.calls == 3
+
+    assert await p.upload_file(client, urls[0]) == "f1"
+    assert client.calls == 3
+    assert await p.upload_file(client, urls[1]) == "f4"
+
+
+async def test_attachment_processor_cache_size_zero_keeps_uploading():
+    client = DummyClient()
+    p = AttachmentProcessor(logger=logger, max_cache_size=0)
+    urls = [
+        f"data:image/jpeg;base64,{base64.b64encode(name.encode()).decode()}"
+        for name in ("first", "second")
+    ]
+
+    assert await p.upload_file(client, urls[0]) == "f1"
+    assert await p.upload_file(client, urls[1]) == "f2"
+    assert len(p._cache) == 1
+
+
+async def test_attachment_processor_coalesces_concurrent_uploads():
+    release = asyncio.Event()
+
+    class SlowClient(DummyClient):
+        async def aupload_file(self, file_tuple):
+            await release.wait()
+            return await super().aupload_file(file_tuple)
+
+    client = SlowClient()
+    p = AttachmentProcessor(logger=logger)
+    data_url = "data:image/jpeg;base64," + base64.b64encode(b"\xff\xd8").decode()
+
+    uploads = [asyncio.create_task(p.upload_file(client, data_url)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*uploads) == ["f1", "f1", "f1"]
+    assert client.calls == 1
+    assert p._inflight == {}
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("data:image/png;base64,AAAA", ("image/png", "AAAA")),
+        ("data:image/png;charset=x;base64,AAAA", ("image/png;charset=x", "AAAA")),
+        ("data:a;base64,b;base64,c", ("a;base64,b", "c")),
+        ("data:a;base64,b;base64,", ("a", "b;base64,")),
+        ("data:;base64,AAAA", None),
+        ("data:image/png;base64,", None),
+        ("data:image/png;base64,AA\nAA", ("image/png", "AA")),
+        ("https://example.com/data:image/png;base64,AAAA", ("image/png", "AAAA")),
+        ("https://example.com/image.png", None),
+    ],
+)
+def test_split_base64_data_url_matches_pattern_semantics(url, expected):
+    assert AttachmentProcessor._split_base64_data_url(url) == expected
+
+
+@pytest.mark.parametrize(
+    ("content_type", "filename", "expected"),
+    [
+        ("Image/PNG; charset=binary", None, "image"),
+        ("application/octet-stream", "voice.MP3", "audio"),
+        ("application/octet-stream", "archive.tar.pdf", "text"),
+        ("application/octet-stream", "mp3", "unknown"),
+        ("application/octet-stream", "trailing.", "unknown"),
+    ],
+)
+def test_classify_file_kind_uses_main_type_then_extension(
+    content_type, filename, expected
+):
+    p = AttachmentProcessor(logger=logger)
+
+    assert p._classify_file_kind(content_type, filename) == expected
+
+
+@pytest.mark.parametrize(
+    ("encoded", "expected"),
+    [
+        ("", 0),
+        ("  \n", 0),
+        ("QUJD", 3),
+        ("QUI=", 2),
+        ("QQ==", 1),
+        (" QQ==\n", 1),
+        ("QQ===", 0),
+    ],
+)
+def test_estimate_base64_size(encoded, expected):
+    assert AttachmentProcessor._estimate_base64_size(encoded) == expected
+
+
 async def test_attachment_processor_cache_stats():
     """Тест получения статистики кэша"""
 
@@ -1,5 +1,11 @@
+import json
+
+import pytest
+from gigachat.models import FunctionCall, Messages, MessagesRole
 from loguru import logger
+from pydantic import ValidationError
 
+from gpt2giga.common.tools import map_tool_name_to_gigachat
 from gpt2giga.models.config import ProxyConfig
 from gpt2giga.protocol import RequestTransformer
 
@@ -19,3 +25,33 @@ def test_transform_response_format_instructions_and_list_messages():
     # Ожидаем system + function_call (как mock_completion) + function output + user
     roles = [m["role"] for m in payload]
     assert roles[0] == "system" and roles[-1] in ("user", "function")
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        {"type": "function_call", "name": "sum", "arguments": '{"a": 1}'},
+        {"type": "function_call", "name": "web_search", "arguments": {"q": "x"}},
+        {"type": "function_call", "name": "noop"},
+    ],
+)
+def test_mock_completion_matches_messages_dump(message):
+    raw_arguments = message.get("arguments", {})
+    expected = Messages(
+        role=MessagesRole.ASSISTANT,
+        function_call=FunctionCall(
+            name=map_tool_name_to_gigachat(message["name"]),
+            arguments=(
+                json.loads(raw_arguments)
+                if isinstance(raw_arguments, str)
+                else raw_arguments
+            ),
+        ),
+    ).model_dump(exclude_none=True)
+
+    assert RequestTransformer.mock_completion(message) == expected
+
+
+def test_mock_completion_rejects_missing_name():
+    with pytest.raises(ValidationError):
+        RequestTransformer.mock_completion({"type": "function_call", "arguments": "{}"})
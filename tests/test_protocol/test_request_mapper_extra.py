@@ -48,13 +48,25 @@ async def test_process_content_parts_limits(request_transformer):
     )
 
 
-async def test_process_content_parts_file(request_transformer):
+async def test_process_content_parts_file(
+    request_transformer, mock_logger, mock_attachment_processor
+):
+    giga_client = object()
     content = [{"type": "file", "file": {"filename": "f.txt", "file_data": "data"}}]
     texts, attachments = await request_transformer._process_content_parts(
-        content, giga_client=object()
+        content, giga_client=giga_client
     )
     assert len(attachments) == 1
     assert attachments[0] == "file_id_123"
+    mock_attachment_processor.upload_file_with_meta.assert_awaited_once_with(
+        giga_client,
+        "data",
+        filename="f.txt",
+        max_audio_image_total_remaining=(
+            request_transformer.config.proxy_settings.max_audio_image_total_size_bytes
+        ),
+    )
+    mock_logger.info.assert_called_once_with("Added attachment: {}", "file_id_123")
 
 
 async def test_transform_messages_roles(request_transformer):
@@ -88,6 +100,25 @@ async def test_transform_messages_roles(request_transformer):
     assert res[2]["content"] == '{"result": "tool_res"}'
 
 
+@pytest.mark.parametrize(("log_level", "expected_calls"), [("INFO", 0), ("DEBUG", 2)])
+async def test_transform_messages_logs_per_message_only_at_debug(
+    mock_logger, log_level, expected_calls
+):
+    config = ProxyConfig(proxy=ProxySettings(log_level=log_level))
+    rt = RequestTransformer(config, mock_logger)
+
+    await rt.transform_messages(
+        [{"role": "user", "content": "a"}, {"role": "assistant", "content": "b"}]
+    )
+
+    processing_calls = [
+        call
+        for call in mock_logger.debug.call_args_list
+        if call.args and str(call.args[0]).startswith("Processing message")
+    ]
+    assert len(processing_calls) == expected_calls
+
+
 async def test_transform_messages_tool_calls_bad_json(request_transformer):
     messages = [
         {
@@ -72,6 +72,7 @@ async def test_jsonl_traffic_log_sink_writes_one_event(tmp_path):
 
     lines = path.read_text(encoding="utf-8").splitlines()
     assert len(lines) == 1
+    assert '"request_id":"req-1"' in lines[0]
     payload = json.loads(lines[0])
     assert payload["request_id"] == "req-1"
     assert payload["created_at"]
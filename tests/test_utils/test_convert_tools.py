@@ -5,6 +5,8 @@ from gpt2giga.common.json_schema import (
 from gpt2giga.common.tools import (
     build_gigachat_builtin_tool_payload,
     convert_tool_to_giga_functions,
+    map_tool_name_from_gigachat,
+    map_tool_name_to_gigachat,
     normalize_gigachat_builtin_tool_type,
 )
 
@@ -714,3 +716,12 @@ def test_convert_tool_with_mcp_literal_enums():
     assert "enum" not in manifest["version"]
     assert snapshot["status"]["enum"] == ["ready", "partial", "blocked", "fixture"]
     assert "enum" not in snapshot["version"]
+
+
+def test_map_tool_name_round_trips_only_the_reserved_name():
+    mapped = map_tool_name_to_gigachat("web_search")
+
+    assert mapped == "__gpt2giga_user_search_web"
+    assert map_tool_name_from_gigachat(mapped) == "web_search"
+    assert map_tool_name_to_gigachat("get_weather") == "get_weather"
+    assert map_tool_name_from_gigachat("get_weather") == "get_weather"
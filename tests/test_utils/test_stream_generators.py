@@ -5,9 +5,13 @@ from unittest.mock import MagicMock
 
 import gigachat.exceptions
 import pytest
+from gigachat.models import ChatCompletionChunk as V1ChatCompletionChunk
 from gigachat.models.chat_completions import ChatCompletionChunk
 
+from gpt2giga.common import streaming
 from gpt2giga.common.streaming import (
+    _prefetch_upstream,
+    coalesce_sse_frames,
     stream_chat_completion_generator,
     stream_chat_generator,
     stream_responses_chat_completion_generator,
@@ -552,6 +556,9 @@ async def test_stream_responses_generator_gigachat_exception():
     assert "GigaChat API error occurred" not in lines[2]
     assert "stream_error" in lines[2]
     assert "event: error" in lines[2]
+    template, *args = logger.error.call_args.args
+    assert template == "[{}] GigaChat streaming error: {}: {}"
+    assert args[1] == "GigaChatException"
 
 
 async def test_stream_responses_chat_completion_generator_text_and_usage():
@@ -1118,6 +1125,57 @@ async def test_stream_responses_generator_propagates_cancellation():
         await anext(gen)
 
 
+async def test_coalesce_sse_frames_joins_only_ready_frames():
+    async def frames():
+        yield "event: a\ndata: {}\n\n"
+        yield "event: b\ndata: {}\n\n"
+        await asyncio.sleep(0.01)
+        yield "event: c\ndata: {}\n\n"
+
+    chunks = [chunk async for chunk in coalesce_sse_frames(frames())]
+
+    assert chunks == [
+        "event: a\ndata: {}\n\nevent: b\ndata: {}\n\n",
+        "event: c\ndata: {}\n\n",
+    ]
+
+
+async def test_coalesce_sse_frames_flushes_before_reraising():
+    async def frames():
+        yield "data: 1\n\n"
+        await asyncio.sleep(0)
+        raise asyncio.CancelledError
+
+    gen = coalesce_sse_frames(frames())
+
+    assert await anext(gen) == "data: 1\n\n"
+    with pytest.raises(asyncio.CancelledError):
+        await anext(gen)
+
+
+async def test_prefetch_upstream_reads_ahead_and_stops_on_close():
+    read = []
+    closed = asyncio.Event()
+
+    async def upstream():
+        try:
+            for index in range(100):
+                read.append(index)
+                yield index
+                await asyncio.sleep(0)
+        finally:
+            closed.set()
+
+    gen = _prefetch_upstream(upstream(), maxsize=4)
+
+    assert await anext(gen) == 0
+    await asyncio.sleep(0.01)
+    assert 1 < len(read) < 100
+
+    await gen.aclose()
+    assert closed.is_set()
+
+
 async def test_stream_chat_generator_success_with_disconnect():
     """Тест корректного завершения при отключении клиента"""
 
@@ -1255,6 +1313,199 @@ async def test_stream_responses_generator_success():
     assert data["response"]["output"][0]["content"][0]["text"] == "AB"
 
 
+async def test_stream_responses_generator_reads_sdk_chunks_without_full_dump():
+    chunks = [
+        V1ChatCompletionChunk.model_validate(
+            {
+                "choices": [
+                    {
+                        "index": 0,
+                        "delta": {
+                            "role": "assistant",
+                            "function_call": {"name": "get_weather"},
+                            "functions_state_id": "state-1",
+                        },
+                    }
+                ],
+                "created": 1,
+                "model": "giga",
+                "object": "chat.completion.chunk",
+            }
+        ),
+        V1ChatCompletionChunk.model_validate(
+            {
+                "choices": [
+                    {
+                        "index": 0,
+                        "delta": {
+                            "function_call": {
+                                "name": "get_weather",
+                                "arguments": {"city": "Msk"},
+                            }
+                        },
+                        "finish_reason": "function_call",
+                    }
+                ],
+                "created": 1,
+                "model": "giga",
+                "object": "chat.completion.chunk",
+                "usage": {
+                    "prompt_tokens": 3,
+                    "completion_tokens": 4,
+                    "total_tokens": 7,
+                },
+            }
+        ),
+    ]
+
+    class SdkChunkClient:
+        def astream(self, chat):
+            async def gen():
+                for chunk in chunks:
+                    yield chunk
+
+            return gen()
+
+    req = FakeRequest(SdkChunkClient())
+    lines = [
+        line
+        async for line in stream_responses_generator(
+            req, SimpleNamespace(model="giga"), response_id="sdk"
+        )
+    ]
+
+    events = [
+        json.loads(line.strip().split("\n")[1].removeprefix("data: ")) for line in lines
+    ]
+    args_done = next(
+        event
+        for event in events
+        if event["type"] == "response.function_call_arguments.done"
+    )
+    completed = events[-1]
+    assert args_done["name"] == "get_weather"
+    assert json.loads(args_done["arguments"]) == {"city": "Msk"}
+    assert completed["type"] == "response.completed"
+    assert completed["response"]["usage"]["total_tokens"] == 7
+    assert json.loads(completed["response"]["metadata"]["gigachat_called_tools"]) == [
+        {
+            "index": 0,
+            "name": "get_weather",
+            "arguments": {"city": "Msk"},
+            "tools_state_id": "state-1",
+        }
+    ]
+
+
+async def test_stream_responses_generator_skips_empty_sdk_chunks(monkeypatch):
+    def sdk_chunk(delta, finish_reason=None):
+        return V1ChatCompletionChunk.model_validate(
+            {
+                "choices": [
+                    {"index": 0, "delta": delta, "finish_reason": finish_reason}
+                ],
+                "created": 1,
+                "model": "giga",
+                "object": "chat.completion.chunk",
+            }
+        )
+
+    chunks = [
+        sdk_chunk({"role": "assistant"}),
+        sdk_chunk({"content": "Hi"}),
+        sdk_chunk({}, finish_reason="stop"),
+    ]
+
+    class SdkChunkClient:
+        def astream(self, chat):
+            async def gen():
+                for chunk in chunks:
+                    yield chunk
+
+            return gen()
+
+    read_chunks = []
+    original_payload = streaming._stream_chunk_payload
+
+    def record_payload(chunk):
+        read_chunks.append(chunk)
+        return original_payload(chunk)
+
+    monkeypatch.setattr(streaming, "_stream_chunk_payload", record_payload)
+    req = FakeRequest(SdkChunkClient())
+    lines = [
+        line
+        async for line in stream_responses_generator(
+            req, SimpleNamespace(model="giga"), response_id="empty"
+        )
+    ]
+
+    completed = json.loads(lines[-1].strip().split("\n")[1].removeprefix("data: "))
+    assert read_chunks == [chunks[1]]
+    assert completed["response"]["output"][0]["content"][0]["text"] == "Hi"
+
+
+async def test_stream_responses_generator_skips_empty_chunks_with_sdk_x_headers(
+    monkeypatch,
+):
+    x_headers = {
+        "x-request-id": "req-1",
+        "x-session-id": "sess-1",
+        "x-client-id": None,
+    }
+
+    def sdk_chunk(delta, finish_reason=None):
+        chunk = V1ChatCompletionChunk.model_validate(
+            {
+                "choices": [
+                    {"index": 0, "delta": delta, "finish_reason": finish_reason}
+                ],
+                "created": 1,
+                "model": "giga",
+                "object": "chat.completion.chunk",
+            }
+        )
+        # The SDK stream attaches the same response headers to every chunk.
+        chunk.x_headers = x_headers
+        return chunk
+
+    chunks = [
+        sdk_chunk({"role": "assistant"}),
+        sdk_chunk({"content": "Hi"}),
+        sdk_chunk({"role": "assistant"}),
+        sdk_chunk({}, finish_reason="stop"),
+    ]
+
+    class SdkChunkClient:
+        def astream(self, chat):
+            async def gen():
+                for chunk in chunks:
+                    yield chunk
+
+            return gen()
+
+    read_chunks = []
+    original_payload = streaming._stream_chunk_payload
+
+    def record_payload(chunk):
+        read_chunks.append(chunk)
+        return original_payload(chunk)
+
+    monkeypatch.setattr(streaming, "_stream_chunk_payload", record_payload)
+    req = FakeRequest(SdkChunkClient())
+    lines = [
+        line
+        async for line in stream_responses_generator(
+            req, SimpleNamespace(model="giga"), response_id="headers"
+        )
+    ]
+
+    completed = json.loads(lines[-1].strip().split("\n")[1].removeprefix("data: "))
+    assert read_chunks == chunks[:2]
+    assert completed["response"]["output"][0]["content"][0]["text"] == "Hi"
+    assert completed["response"]["metadata"]["gigachat_x_request_id"] == "req-1"
+
+
 async def test_stream_responses_generator_ignores_null_reasoning_content():
     req = FakeRequest(FakeClientNullReasoning())
     chat = SimpleNamespace(model="giga")
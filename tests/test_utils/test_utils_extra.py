@@ -1,5 +1,9 @@
+import json
+
 from gigachat.models import Function
+import pytest
 
+from gpt2giga.common.content_utils import ensure_json_object_str
 from gpt2giga.common.tools import (
     convert_tool_to_giga_functions,
     split_gigachat_tool_name,
@@ -96,3 +100,22 @@ def test_convert_tool_to_giga_functions_namespace_tools():
         funcs[0].name,
         request_tools=data["tools"],
     ) == ("browser_navigate", "mcp__playwright")
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("Build failed: see logs", '{"result": "Build failed: see logs"}'),
+        ("{'city': 'Moscow'}", '{"city": "Moscow"}'),
+        ("('a', 1)", '{"result": ["a", 1]}'),
+        ("None", '{"result": null}'),
+        ("u'text'", '{"result": "text"}'),
+        ("+5", '{"result": 5}'),
+        ("up'to", '{"result": "up\'to"}'),
+        (json.dumps("\n{'city': 'Msk'}\n"), '{"city": "Msk"}'),
+        (json.dumps(" {'a': 1}"), '{"a": 1}'),
+        (json.dumps("\t u'text'"), '{"result": "text"}'),
+    ],
+)
+def test_ensure_json_object_str_parses_only_python_literals(value, expected):
+    assert ensure_json_object_str(value) == expected